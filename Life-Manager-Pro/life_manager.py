@@ -2,16 +2,2988 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import ttkbootstrap as ttb
 from ttkbootstrap.constants import *
-from datetime import datetime, timedelta
+from datetime import datetime, date, timedelta
 import json
 import os
+import time
+import sqlite3
+import bisect
+import uuid
+import re
+import sys
+import math
+import threading
+import queue
+import heapq
+import itertools
+import functools
+import importlib
+import smtplib
+from email.message import EmailMessage
+from collections import deque
 from ttkbootstrap.scrolled import ScrolledFrame
-from PIL import Image, ImageTk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+# matplotlib is imported on first use by the chart classes, or pre-warmed in
+# the background once the window is up; see prewarm_charts()
+
+# Startup milestones are measured from here
+STARTUP_STARTED = time.perf_counter()
+
+DATA_FILE = 'life_manager_data.json'
+JOURNAL_FILE = 'life_manager_data.journal'
+DB_FILE = 'life_manager_data.db'
+SETTINGS_FILE = 'settings.json'
+SEARCH_INDEX_FILE = 'life_manager_data.search.json'
+ROLLUP_FILE = 'life_manager_data.rollup.json'
+ACTIVITY_FILE = 'life_manager_activity.log'
+DECORATION_CACHE_DIR = 'life_manager_cache'
+AUTOSAVE_INTERVAL = 5 * 60 * 1000
+OUTBOX_FILE = 'life_manager_outbox.json'
+STARTUP_LOG = 'life_manager_startup.log'
+
+
+def write_json_atomic(path, data):
+    """Write JSON to a temp file, fsync it and rename it over path"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+# The parsers are cached, so records on the same day or at the same time
+# share one int rather than each holding its own
+@functools.lru_cache(maxsize=65536)
+def parse_date_ordinal(value):
+    """Turn a YYYY-MM-DD string into a day number, or None if invalid"""
+    try:
+        return date.fromisoformat(value).toordinal()
+    except (TypeError, ValueError):
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_time_minutes(value):
+    """Turn an HH:MM string into minutes after midnight, or None if invalid"""
+    try:
+        hour, minute = value.split(':')
+        hour, minute = int(hour), int(minute)
+    except (AttributeError, ValueError):
+        return None
+    if 0 <= hour <= 23 and 0 <= minute <= 59:
+        return hour * 60 + minute
+    return None
+
+
+def format_minutes(minutes):
+    """Format minutes after midnight as a 12-hour clock time"""
+    hour, minute = divmod(minutes, 60)
+    return f"{(hour % 12) or 12:02d}:{minute:02d} {'AM' if hour < 12 else 'PM'}"
+
+
+def format_ago(seconds):
+    """Describe an age in seconds the way the activity panels show it"""
+    minutes = int(seconds // 60)
+    if minutes < 1:
+        return "just now"
+    if minutes < 60:
+        return f"{minutes} min{'s' if minutes > 1 else ''} ago"
+    hours = minutes // 60
+    if hours < 24:
+        return f"{hours} hour{'s' if hours > 1 else ''} ago"
+    days = hours // 24
+    return f"{days} day{'s' if days > 1 else ''} ago"
+
+
+def lighten(color, amount):
+    """Add amount to each channel of a #rrggbb color"""
+    channels = (int(color[i:i + 2], 16) for i in (1, 3, 5))
+    return '#' + ''.join(f"{min(255, c + amount):02x}" for c in channels)
+
+
+def new_record_id():
+    return uuid.uuid4().hex
+
+
+# Sorts tasks with a missing or invalid date after every real one
+NO_DATE = date.max.toordinal() + 1
+
+
+class Record:
+    """Slotted record that round-trips to the JSON schema
+
+    A field missing from the source dict leaves its slot unset: it reads as
+    None but is left out again by to_dict, while a field stored as null
+    comes back as null. Unknown keys are carried through in extra, which is
+    None for the usual record that has none.
+    """
+
+    __slots__ = ('extra',)
+    FIELDS = ()
+    # Parsed companions of the fields, None until their field is set
+    PARSED = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # The slot each field lives in: its own, or the raw one behind a parsing property
+        cls.STORAGE = tuple(
+            getattr(cls, '_' + name if '_' + name in cls.__slots__ else name)
+            for name in cls.FIELDS
+        )
+
+    def __init__(self, **fields):
+        for name in self.PARSED:
+            setattr(self, name, None)
+        for name in self.FIELDS:
+            if name in fields:
+                setattr(self, name, fields.pop(name))
+        # A fresh dict, as the emptied **fields one keeps its full size
+        self.extra = dict(fields) if fields else None
+
+    def __getattr__(self, name):
+        # Only reached when a field's slot was never set
+        if name in self.FIELDS:
+            return None
+        raise AttributeError(name)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+    def to_dict(self):
+        data = {}
+        for name, slot in zip(self.FIELDS, self.STORAGE):
+            try:
+                data[name] = slot.__get__(self)
+            except AttributeError:
+                continue
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def copy(self):
+        return type(self).from_dict(self.to_dict())
+
+
+class Task(Record):
+    """A task with its date, time and due date parsed once on assignment"""
+
+    __slots__ = ('id', 'title', 'priority', 'description', 'completed', 'category',
+                 'created_date', 'completion_date',
+                 '_date', 'date_ord', '_time', 'time_min', '_due_date', 'due_ord')
+    FIELDS = ('id', 'title', 'date', 'time', 'priority', 'description', 'completed',
+              'category', 'due_date', 'created_date', 'completion_date')
+    PARSED = ('date_ord', 'time_min', 'due_ord')
+
+    @property
+    def date(self):
+        return self._date
+
+    @date.setter
+    def date(self, value):
+        self._date = value
+        self.date_ord = parse_date_ordinal(value)
+
+    @property
+    def time(self):
+        return self._time
+
+    @time.setter
+    def time(self, value):
+        self._time = value
+        self.time_min = parse_time_minutes(value)
+
+    @property
+    def due_date(self):
+        return self._due_date
+
+    @due_date.setter
+    def due_date(self, value):
+        self._due_date = value
+        self.due_ord = parse_date_ordinal(value)
+
+    def sort_key(self):
+        date_ord = self.date_ord if self.date_ord is not None else NO_DATE
+        return (date_ord, self.time_min or 0, self.id)
+
+
+class Goal(Record):
+    """A goal with its target date parsed once on assignment"""
+
+    __slots__ = ('id', 'title', 'category', 'description', 'milestones', 'completed',
+                 'progress', '_target_date', 'target_ord')
+    FIELDS = ('id', 'title', 'target_date', 'category', 'description', 'milestones',
+              'completed', 'progress')
+    PARSED = ('target_ord',)
+
+    @property
+    def target_date(self):
+        return self._target_date
+
+    @target_date.setter
+    def target_date(self, value):
+        self._target_date = value
+        self.target_ord = parse_date_ordinal(value)
+
+
+RECORD_TYPES = {
+    'tasks': Task,
+    'goals': Goal
+}
+
+
+def group_by_date(tasks):
+    """Split tasks already in date order into (date_ord, tasks) runs"""
+    groups = []
+    for task in tasks:
+        if not groups or groups[-1][0] != task.date_ord:
+            groups.append((task.date_ord, []))
+        groups[-1][1].append(task)
+    return groups
+
+
+class TaskDateIndex:
+    """Tasks bucketed by date in (date, time, id) order, split by completion
+
+    Undated tasks sit in a NO_DATE bucket after every real date. Each bucket
+    holds sorted (time, id) keys, so range lookups come back already ordered.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.rebuild()
+
+    def rebuild(self):
+        self.by_date = {}
+        self.dates = []
+        self.done = {}
+        self.open = {}
+        self.done_keys = []
+        for task in self.store.tasks:
+            self.insert(task)
+
+    def insert(self, task):
+        key = task.sort_key()
+        day = key[0]
+        bucket = self.by_date.get(day)
+        if bucket is None:
+            bucket = self.by_date[day] = []
+            bisect.insort(self.dates, day)
+        bisect.insort(bucket, key[1:])
+        if task.completed:
+            self.done[task.id] = task
+            bisect.insort(self.done_keys, key)
+        else:
+            self.open[task.id] = task
+
+    def discard(self, task):
+        key = task.sort_key()
+        day = key[0]
+        bucket = self.by_date.get(day)
+        if bucket is not None:
+            position = bisect.bisect_left(bucket, key[1:])
+            if position < len(bucket) and bucket[position] == key[1:]:
+                del bucket[position]
+            if not bucket:
+                del self.by_date[day]
+                del self.dates[bisect.bisect_left(self.dates, day)]
+        if self.done.pop(task.id, None) is not None:
+            position = bisect.bisect_left(self.done_keys, key)
+            if position < len(self.done_keys) and self.done_keys[position] == key:
+                del self.done_keys[position]
+        self.open.pop(task.id, None)
+
+    def record_changed(self, event, kind, record, old):
+        if event in ('load', 'clear'):
+            self.rebuild()
+        elif kind != 'tasks':
+            return
+        elif event == 'add':
+            self.insert(record)
+        elif event == 'remove':
+            self.discard(record)
+        elif event == 'update':
+            self.discard(old)
+            self.insert(record)
+
+    def between(self, low=None, high=None, undated=False):
+        """Ordered tasks dated from low to high inclusive, as day ordinals"""
+        if high is None and not undated:
+            high = NO_DATE - 1
+        start = 0 if low is None else bisect.bisect_left(self.dates, low)
+        stop = len(self.dates) if high is None else bisect.bisect_right(self.dates, high)
+        task_map = self.store.task_map
+        return [
+            task_map[task_id]
+            for day in self.dates[start:stop]
+            for _, task_id in self.by_date[day]
+        ]
+
+    def completed_tasks(self):
+        task_map = self.store.task_map
+        return [task_map[key[-1]] for key in self.done_keys]
+
+
+class StoreStats:
+    """Running task and goal counts behind the stat cards, updated per change"""
+
+    def __init__(self, store):
+        self.store = store
+        self.rebuild()
+
+    def rebuild(self):
+        self.tasks_total = 0
+        self.tasks_completed = 0
+        # Day ordinal -> [tasks, open tasks]
+        self.days = {}
+        # Open tasks dated before self.today, moved along as days pass
+        self.today = date.today().toordinal()
+        self.overdue_count = 0
+        self.goals_total = 0
+        self.goals_completed = 0
+        self.categories = {}
+        for task in self.store.tasks:
+            self.count('tasks', task, 1)
+        for goal in self.store.goals:
+            self.count('goals', goal, 1)
+
+    def count(self, kind, record, step):
+        if kind == 'goals':
+            self.goals_total += step
+            if record.completed:
+                self.goals_completed += step
+            category = record.category or 'Uncategorized'
+            self.categories[category] = self.categories.get(category, 0) + step
+            if not self.categories[category]:
+                del self.categories[category]
+            return
+        
+        self.tasks_total += step
+        if record.completed:
+            self.tasks_completed += step
+        day = record.date_ord
+        if day is None:
+            return
+        counts = self.days.setdefault(day, [0, 0])
+        counts[0] += step
+        if not record.completed:
+            counts[1] += step
+            if day < self.today:
+                self.overdue_count += step
+        if not counts[0]:
+            del self.days[day]
+
+    def record_changed(self, event, kind, record, old):
+        if event in ('load', 'clear'):
+            self.rebuild()
+        elif event == 'add':
+            self.count(kind, record, 1)
+        elif event == 'remove':
+            self.count(kind, record, -1)
+        elif event == 'update':
+            self.count(kind, old, -1)
+            self.count(kind, record, 1)
+
+    def roll_to(self, today):
+        """Move the overdue boundary to a new day"""
+        if self.today < today <= self.today + 31:
+            for day in range(self.today, today):
+                self.overdue_count += self.days.get(day, (0, 0))[1]
+        else:
+            self.overdue_count = sum(counts[1] for day, counts in self.days.items() if day < today)
+        self.today = today
+
+    def current_day(self):
+        # Moved along by roll_to, which the app's clock calls at midnight
+        return self.today
+
+    def due_today(self):
+        return self.days.get(self.current_day(), (0, 0))[0]
+
+    def overdue(self):
+        return self.overdue_count
+
+    def this_week(self):
+        today = self.current_day()
+        monday = today - date.fromordinal(today).weekday()
+        return sum(self.days.get(day, (0, 0))[0] for day in range(monday, monday + 7))
+
+    def goals_active(self):
+        return self.goals_total - self.goals_completed
+
+    def completion_rate(self):
+        total = self.tasks_total
+        return round((self.tasks_completed / total * 100) if total > 0 else 0)
+
+
+class DailyRollup:
+    """Per-day task counts, kept up to date as tasks are added and completed
+
+    days maps a day ordinal to [completed, created, {category: completed},
+    {priority: completed}], so a chart over N days reads N entries however
+    many tasks there are. Completions count on a task's completion_date and
+    creations on its created_date; tasks without them are not counted.
+    """
+
+    def __init__(self, store, path=None):
+        self.store = store
+        self.path = path
+        self.reset()
+        store.subscribe(self.record_changed)
+
+    def reset(self):
+        self.days = {}
+
+    def rebuild(self):
+        self.reset()
+        for task in self.store.tasks:
+            self.count(task, 1)
+
+    def count(self, task, step):
+        created = parse_date_ordinal(task.created_date)
+        if created is not None:
+            self.add_to(created, 1, step)
+        finished = parse_date_ordinal(task.completion_date) if task.completed else None
+        if finished is not None:
+            counts = self.add_to(finished, 0, step)
+            for breakdown, key in ((counts[2], task.category or 'Uncategorized'),
+                                   (counts[3], task.priority or 'None')):
+                breakdown[key] = breakdown.get(key, 0) + step
+                if not breakdown[key]:
+                    del breakdown[key]
+
+    def add_to(self, day, column, step):
+        counts = self.days.get(day)
+        if counts is None:
+            counts = self.days[day] = [0, 0, {}, {}]
+        counts[column] += step
+        if not counts[0] and not counts[1]:
+            del self.days[day]
+        return counts
+
+    def record_changed(self, event, kind, record, old):
+        if event == 'load':
+            if not self.load():
+                self.rebuild()
+        elif event == 'clear':
+            self.reset()
+        elif kind != 'tasks':
+            return
+        elif event == 'add':
+            self.count(record, 1)
+        elif event == 'remove':
+            self.count(record, -1)
+        elif event == 'update':
+            self.count(old, -1)
+            self.count(record, 1)
+
+    def completed(self, low, high):
+        """Tasks completed on each day from low to high, as day ordinals"""
+        return tuple(self.days[day][0] if day in self.days else 0 for day in range(low, high + 1))
+
+    def created(self, low, high):
+        return tuple(self.days[day][1] if day in self.days else 0 for day in range(low, high + 1))
+
+    def breakdown(self, low, high, column):
+        totals = {}
+        for day in range(low, high + 1):
+            counts = self.days.get(day)
+            if counts is not None:
+                for key, count in counts[column].items():
+                    totals[key] = totals.get(key, 0) + count
+        return totals
+
+    def by_category(self, low, high):
+        """Completions per category over days low to high"""
+        return self.breakdown(low, high, 2)
+
+    def by_priority(self, low, high):
+        return self.breakdown(low, high, 3)
+
+    def streak(self, today):
+        """Days in a row, up to today, with at least one task completed
+
+        A day with nothing done yet doesn't break the streak until it's over.
+        """
+        day = today if self.days.get(today, (0,))[0] else today - 1
+        count = 0
+        while self.days.get(day, (0,))[0]:
+            count += 1
+            day -= 1
+        return count
+
+    def save(self):
+        """Write the rollup next to the data file, tagged with the data revision"""
+        job = self.prepare_write()
+        if job is not None:
+            job()
+
+    def prepare_write(self):
+        """Copy the rollup now and return a callable writing the copy, or None"""
+        if self.path is None or self.store.revision is None:
+            return None
+        data = {
+            'revision': self.store.revision,
+            'days': {
+                day: [completed, created, dict(categories), dict(priorities)]
+                for day, (completed, created, categories, priorities) in self.days.items()
+            }
+        }
+        return lambda: write_json_atomic(self.path, data)
+
+    def load(self):
+        """Reuse the saved rollup if it matches the data just loaded"""
+        if self.path is None or self.store.revision is None or not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except ValueError:
+            return False
+        if data.get('revision') != self.store.revision:
+            return False
+        
+        # JSON object keys come back as strings
+        self.days = {int(day): counts for day, counts in data['days'].items()}
+        return True
+
+
+class ActivityLog:
+    """Append-only log of every change to tasks and goals
+
+    Each event is a compact [timestamp, action, kind, id, title] list. The
+    newest ones are kept in a bounded ring for the Recent Activity panels,
+    and all of them are appended as JSON lines to an on-disk segment.
+    """
+
+    ACTIONS = {
+        'add': "Added",
+        'update': "Updated",
+        'complete': "Completed",
+        'remove': "Deleted",
+        'clear': "Cleared all data"
+    }
+
+    def __init__(self, store, path=None, keep=50):
+        self.store = store
+        self.path = path
+        self.recent = deque(maxlen=keep)
+        # Lines not yet on disk; set by WriteBehindSaver, else written at once
+        self.pending = []
+        self.saver = None
+        self.load_recent()
+        store.subscribe(self.record_changed)
+
+    def record_changed(self, event, kind, record, old):
+        if event == 'load':
+            return
+        if event == 'clear':
+            self.append([int(time.time()), 'clear', None, None, None])
+            return
+        
+        action = event
+        if event == 'update' and record.completed and not old.completed:
+            action = 'complete'
+        self.append([int(time.time()), action, kind, record.id, record.title])
+
+    def append(self, entry):
+        self.recent.append(entry)
+        if self.path is None:
+            return
+        self.pending.append(json.dumps(entry, separators=(',', ':')) + '\n')
+        if self.saver is not None:
+            self.saver.schedule()
+        else:
+            self.write_lines(self.prepare_lines())
+
+    def prepare_lines(self):
+        lines = self.pending
+        self.pending = []
+        return lines
+
+    def prepare_write(self):
+        """Return a callable appending the pending lines, or None"""
+        if not self.pending:
+            return None
+        lines = self.prepare_lines()
+        return lambda: self.write_lines(lines)
+
+    def write_lines(self, lines):
+        with open(self.path, 'a') as f:
+            f.writelines(lines)
+
+    def load_recent(self):
+        """Fill the ring from the end of the segment, without reading it all"""
+        if self.path is None or not os.path.exists(self.path):
+            return
+        # Lines are short, so this many bytes holds more than the ring keeps
+        tail_bytes = 256 * self.recent.maxlen
+        with open(self.path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            size = f.tell()
+            f.seek(max(0, size - tail_bytes))
+            lines = f.read().splitlines()
+        if size > tail_bytes:
+            # The first line is most likely cut off
+            lines = lines[1:]
+        for line in lines[-self.recent.maxlen:]:
+            try:
+                self.recent.append(json.loads(line))
+            except ValueError:
+                continue
+
+    def history(self):
+        """Every event on disk, oldest first"""
+        if self.path is None or not os.path.exists(self.path):
+            return
+        with open(self.path, 'r') as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+    def latest(self, count):
+        """The newest events, newest first"""
+        return list(reversed(self.recent))[:count]
+
+    def describe(self, entry):
+        _, action, kind, _, title = entry
+        text = self.ACTIONS.get(action, action)
+        if kind is not None:
+            text += f" {kind[:-1]}"
+            if title:
+                text += f": {title}"
+        return text
+
+
+class ReminderEngine:
+    """Fires a callback when open tasks and goals fall due
+
+    Fire times sit in a min-heap of (when, kind, id), with the live time per
+    record in scheduled. A change pushes a new entry and leaves the old one
+    to be skipped when it surfaces, so add, edit, complete and delete are
+    O(log n). One timer job sleeps until the earliest entry.
+    """
+
+    # Reminder time for goals and for tasks without a time, in minutes
+    DEFAULT_TIME = 9 * 60
+    # Longest single sleep, so a suspend or clock change is noticed in time
+    MAX_SLEEP = 60 * 60
+
+    def __init__(self, store, timers, on_due, lead_minutes=0):
+        self.store = store
+        self.timers = timers
+        self.on_due = on_due
+        self.lead = lead_minutes * 60
+        self.job = None
+        self.rebuild()
+        store.subscribe(self.record_changed)
+
+    def fire_time(self, kind, record):
+        """Epoch seconds to remind at, or None for nothing to remind of"""
+        if record.completed:
+            return None
+        if kind == 'tasks':
+            day, minutes = record.date_ord, record.time_min
+        else:
+            day, minutes = record.target_ord, None
+        if day is None:
+            return None
+        if minutes is None:
+            minutes = self.DEFAULT_TIME
+        moment = datetime.fromordinal(day) + timedelta(minutes=minutes)
+        return moment.timestamp() - self.lead
+
+    def rebuild(self):
+        now = time.time()
+        # Records dated before yesterday can't be due any more, so only open
+        # tasks from yesterday on are asked for
+        first_day = date.today().toordinal() - 1
+        tasks = self.store.find_tasks(after=date.fromordinal(first_day - 1).isoformat(), completed=False)
+        self.scheduled = {}
+        self.heap = []
+        for kind, records in (('tasks', tasks), ('goals', self.store.goals)):
+            for record in records:
+                day = record.date_ord if kind == 'tasks' else record.target_ord
+                if day is None or day < first_day:
+                    continue
+                when = self.fire_time(kind, record)
+                if when is not None and when > now:
+                    self.scheduled[(kind, record.id)] = when
+                    self.heap.append((when, kind, record.id))
+        heapq.heapify(self.heap)
+        self.arm()
+
+    def schedule(self, kind, record):
+        key = (kind, record.id)
+        when = self.fire_time(kind, record)
+        if when is None or when <= time.time():
+            self.scheduled.pop(key, None)
+            return
+        if self.scheduled.get(key) == when:
+            return
+        self.scheduled[key] = when
+        heapq.heappush(self.heap, (when, kind, record.id))
+        # Replaced entries pile up as records are edited; drop them in bulk
+        if len(self.heap) > 2 * len(self.scheduled) + 64:
+            self.heap = [(w, k, i) for (k, i), w in self.scheduled.items()]
+            heapq.heapify(self.heap)
+        if self.heap[0][0] == when:
+            self.arm()
+
+    def record_changed(self, event, kind, record, old):
+        if event in ('load', 'clear'):
+            self.rebuild()
+        elif event == 'remove':
+            self.scheduled.pop((kind, record.id), None)
+        elif event in ('add', 'update'):
+            self.schedule(kind, record)
+
+    def head(self):
+        """The earliest live entry, dropping replaced ones on the way"""
+        heap = self.heap
+        while heap and self.scheduled.get(heap[0][1:]) != heap[0][0]:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def arm(self):
+        if self.job is not None:
+            self.timers.cancel(self.job)
+            self.job = None
+        head = self.head()
+        if head is not None:
+            delay = min(max(0, head[0] - time.time()), self.MAX_SLEEP)
+            self.job = self.timers.after(math.ceil(delay * 1000), self.fire)
+
+    def fire(self):
+        self.job = None
+        now = time.time()
+        due = []
+        while True:
+            head = self.head()
+            if head is None or head[0] > now:
+                break
+            heapq.heappop(self.heap)
+            when, kind, record_id = head
+            del self.scheduled[(kind, record_id)]
+            due.append((kind, record_id))
+        try:
+            for kind, record_id in due:
+                self.on_due(kind, self.store.get(kind, record_id))
+        finally:
+            self.arm()
+
+    def upcoming(self, count):
+        """The next few (when, kind, id) reminders, soonest first"""
+        live = (entry for entry in self.heap if self.scheduled.get(entry[1:]) == entry[0])
+        return heapq.nsmallest(count, live)
+
+
+# Python's ordinal for 1970-01-01, where numpy's datetime64 days start
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+class TaskColumns:
+    """Task dates, completion flags and categories as NumPy columns
+
+    Each task owns a row, found by id through slots, and changes rewrite that
+    row in place; removed tasks free their row for the next add. Queries are
+    vectorized over whole columns, so they stay interactive with a million
+    tasks on file.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.rebuild()
+
+    def rebuild(self):
+        import numpy as np
+        
+        tasks = list(self.store.tasks)
+        count = len(tasks)
+        capacity = max(1024, count + count // 2)
+        # Category name <-> code, with codes never reused
+        self.codes = {}
+        self.names = []
+        # Day ordinal, or -1 for undated tasks and unused rows
+        self.day = np.full(capacity, -1, dtype=np.int32)
+        self.done = np.zeros(capacity, dtype=bool)
+        self.category = np.zeros(capacity, dtype=np.int32)
+        self.alive = np.zeros(capacity, dtype=bool)
+        
+        self.day[:count] = np.fromiter(
+            (-1 if t.date_ord is None else t.date_ord for t in tasks), np.int32, count
+        )
+        self.done[:count] = np.fromiter((bool(t.completed) for t in tasks), bool, count)
+        self.category[:count] = np.fromiter(
+            (self.category_code(t.category) for t in tasks), np.int32, count
+        )
+        self.alive[:count] = True
+        self.slots = {task.id: row for row, task in enumerate(tasks)}
+        # Rows in use so far, and freed rows below that
+        self.used = count
+        self.free = []
+
+    def category_code(self, category):
+        category = category or 'Uncategorized'
+        code = self.codes.get(category)
+        if code is None:
+            code = self.codes[category] = len(self.names)
+            self.names.append(category)
+        return code
+
+    def grow(self):
+        import numpy as np
+        
+        extra = len(self.day)
+        self.day = np.concatenate((self.day, np.full(extra, -1, dtype=np.int32)))
+        self.done = np.concatenate((self.done, np.zeros(extra, dtype=bool)))
+        self.category = np.concatenate((self.category, np.zeros(extra, dtype=np.int32)))
+        self.alive = np.concatenate((self.alive, np.zeros(extra, dtype=bool)))
+
+    def write(self, row, task):
+        self.day[row] = -1 if task.date_ord is None else task.date_ord
+        self.done[row] = bool(task.completed)
+        self.category[row] = self.category_code(task.category)
+        self.alive[row] = True
+
+    def insert(self, task):
+        if self.free:
+            row = self.free.pop()
+        else:
+            if self.used == len(self.day):
+                self.grow()
+            row = self.used
+            self.used += 1
+        self.slots[task.id] = row
+        self.write(row, task)
+
+    def discard(self, task):
+        row = self.slots.pop(task.id, None)
+        if row is not None:
+            self.day[row] = -1
+            self.alive[row] = False
+            self.free.append(row)
+
+    def record_changed(self, event, kind, record, old):
+        if event in ('load', 'clear'):
+            self.rebuild()
+        elif kind != 'tasks':
+            return
+        elif event == 'add':
+            self.insert(record)
+        elif event == 'remove':
+            self.discard(record)
+        elif event == 'update':
+            row = self.slots.get(record.id)
+            if row is None:
+                self.insert(record)
+            else:
+                self.write(row, record)
+
+    def daily(self, low, high):
+        """Completed and total task counts per day, for ordinals low..high"""
+        import numpy as np
+        
+        days = self.day[:self.used]
+        in_range = (days >= low) & (days <= high)
+        offsets = days[in_range] - low
+        length = high - low + 1
+        total = np.bincount(offsets, minlength=length)
+        completed = np.bincount(offsets[self.done[:self.used][in_range]], minlength=length)
+        return completed, total
+
+    def completions(self, low, high, period='day'):
+        """(period start ordinals, completed, total) over days low..high
+
+        period is 'day', 'week' (starting Mondays) or 'month'; the first
+        period is cut short at low and the last at high. Counts go by the
+        date each task is scheduled for.
+        """
+        import numpy as np
+        
+        completed, total = self.daily(low, high)
+        days = np.arange(low, high + 1)
+        if period == 'day':
+            return days, completed, total
+        
+        if period == 'week':
+            # Ordinal 1 was a Monday
+            keys = (days - 1) // 7
+        elif period == 'month':
+            keys = (days - EPOCH_ORDINAL).astype('datetime64[D]').astype('datetime64[M]')
+        else:
+            raise ValueError(f"Unknown period: {period}")
+        starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+        return days[starts], np.add.reduceat(completed, starts), np.add.reduceat(total, starts)
+
+    def category_shares(self, low=None, high=None):
+        """Task count per category, optionally for days low..high only"""
+        import numpy as np
+        
+        rows = self.alive[:self.used]
+        if low is not None or high is not None:
+            days = self.day[:self.used]
+            if low is not None:
+                rows = rows & (days >= low)
+            if high is not None:
+                rows = rows & (days <= high) & (days >= 0)
+        counts = np.bincount(self.category[:self.used][rows], minlength=len(self.names))
+        return {self.names[code]: int(count) for code, count in enumerate(counts) if count}
+
+
+def tokenize(text):
+    return re.findall(r'\w+', text.lower())
+
+
+class SearchIndex:
+    """Inverted word index over tasks and goals for prefix search-as-you-type"""
+
+    FIELDS = {
+        'tasks': ('title', 'description', 'category'),
+        'goals': ('title', 'description', 'category', 'milestones')
+    }
+
+    def __init__(self, store, path=None):
+        self.store = store
+        self.path = path
+        self.reset()
+        store.subscribe(self.record_changed)
+
+    def reset(self):
+        # word -> ids, sorted words for prefix ranges, and id -> words for removal
+        self.postings = {'tasks': {}, 'goals': {}}
+        self.terms = {'tasks': [], 'goals': []}
+        self.record_words = {'tasks': {}, 'goals': {}}
+
+    def rebuild(self):
+        self.reset()
+        for kind in ('tasks', 'goals'):
+            for record in self.store.records(kind).values():
+                self.insert(kind, record)
+
+    def words(self, kind, record):
+        text = []
+        for name in self.FIELDS[kind]:
+            value = getattr(record, name)
+            if isinstance(value, list):
+                text.extend(value)
+            elif value:
+                text.append(value)
+        return set(tokenize(' '.join(text)))
+
+    def insert(self, kind, record):
+        words = self.words(kind, record)
+        self.record_words[kind][record.id] = words
+        postings = self.postings[kind]
+        for word in words:
+            ids = postings.get(word)
+            if ids is None:
+                ids = postings[word] = set()
+                bisect.insort(self.terms[kind], word)
+            ids.add(record.id)
+
+    def discard(self, kind, record_id):
+        postings = self.postings[kind]
+        terms = self.terms[kind]
+        for word in self.record_words[kind].pop(record_id, ()):
+            ids = postings[word]
+            ids.discard(record_id)
+            if not ids:
+                del postings[word]
+                del terms[bisect.bisect_left(terms, word)]
+
+    def record_changed(self, event, kind, record, old):
+        if event == 'load':
+            if not self.load():
+                self.rebuild()
+        elif event == 'clear':
+            self.reset()
+        elif event == 'add':
+            self.insert(kind, record)
+        elif event == 'remove':
+            self.discard(kind, record.id)
+        elif event == 'update':
+            self.discard(kind, record.id)
+            self.insert(kind, record)
+
+    def search(self, kind, query):
+        """Ids of records having a word that starts with each query word"""
+        postings = self.postings[kind]
+        terms = self.terms[kind]
+        result = None
+        # Longest words first, as they usually match the fewest records
+        for word in sorted(set(tokenize(query)), key=len, reverse=True):
+            start = bisect.bisect_left(terms, word)
+            stop = bisect.bisect_left(terms, word + '\uffff')
+            matches = set()
+            for term in terms[start:stop]:
+                matches |= postings[term]
+            result = matches if result is None else result & matches
+            if not result:
+                break
+        return result or set()
+
+    def save(self):
+        """Write the index next to the data file, tagged with the data revision"""
+        job = self.prepare_write()
+        if job is not None:
+            job()
+
+    def prepare_write(self):
+        """Copy the postings now and return a callable writing the copy, or None"""
+        if self.path is None or self.store.revision is None:
+            return None
+        data = {
+            'revision': self.store.revision,
+            'postings': {
+                kind: {word: list(ids) for word, ids in postings.items()}
+                for kind, postings in self.postings.items()
+            }
+        }
+        return lambda: write_json_atomic(self.path, data)
+
+    def load(self):
+        """Reuse the saved index if it matches the data just loaded"""
+        if self.path is None or self.store.revision is None or not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except ValueError:
+            return False
+        if data.get('revision') != self.store.revision:
+            return False
+        
+        self.reset()
+        for kind, postings in data['postings'].items():
+            record_words = self.record_words[kind]
+            for word, ids in postings.items():
+                self.postings[kind][word] = set(ids)
+                for record_id in ids:
+                    record_words.setdefault(record_id, set()).add(word)
+            self.terms[kind] = sorted(postings)
+        return True
+
+
+class DataStore:
+    """In-memory tasks and goals keyed by id, with the queries the views need"""
+
+    # Token naming exactly the data loaded or last changed, when the backend
+    # tracks one; saved caches are reused only when it matches
+    revision = None
+
+    def __init__(self):
+        self.reset()
+        # Set by WriteBehindSaver; without one, writes happen immediately
+        self.saver = None
+        # Called as callback(event, kind, record, old) after every change
+        self.observers = []
+        self.create_indexes()
+
+    def create_indexes(self):
+        """Set up what answers find_tasks and the stat cards"""
+        self.task_index = TaskDateIndex(self)
+        self.subscribe(self.task_index.record_changed)
+        self.stats = StoreStats(self)
+        self.subscribe(self.stats.record_changed)
+
+    @property
+    def tasks(self):
+        return self.task_map.values()
+
+    @property
+    def goals(self):
+        return self.goal_map.values()
+
+    def records(self, kind):
+        if kind == 'tasks':
+            return self.task_map
+        if kind == 'goals':
+            return self.goal_map
+        raise ValueError(f"Unknown record kind: {kind}")
+
+    def get(self, kind, record_id):
+        return self.records(kind)[record_id]
+
+    def put(self, kind, record):
+        """Index a record by id; returns True if it needed a new id"""
+        backfilled = not record.id
+        if backfilled:
+            record.id = new_record_id()
+        self.records(kind)[record.id] = record
+        return backfilled
+
+    def reset(self):
+        # Insertion-ordered id -> record maps, so lookups and deletes are O(1)
+        self.task_map = {}
+        self.goal_map = {}
+
+    def subscribe(self, callback):
+        self.observers.append(callback)
+
+    def notify(self, event, kind=None, record=None, old=None):
+        for callback in self.observers:
+            callback(event, kind, record, old)
+
+    def update_record(self, kind, record_id, fields):
+        """Set fields on a record; returns it with a copy of how it was"""
+        record = self.get(kind, record_id)
+        old = record.copy()
+        for name, value in fields.items():
+            setattr(record, name, value)
+        return record, old
+
+    def find_tasks(self, date=None, after=None, before=None, completed=None, ids=None,
+                   priority=None):
+        """Tasks in (date, time) order, filtered by date string, completion and priority
+
+        ids, typically a search result, limits the lookup to those tasks.
+        """
+        dated = date is not None or after is not None or before is not None
+        if dated:
+            # Narrow to an inclusive range of day ordinals
+            low = high = None
+            if date is not None:
+                low = high = parse_date_ordinal(date)
+                if low is None:
+                    return []
+            if after is not None:
+                day = parse_date_ordinal(after) + 1
+                low = day if low is None else max(low, day)
+            if before is not None:
+                day = parse_date_ordinal(before) - 1
+                high = day if high is None else min(high, day)
+        
+        if ids is not None:
+            tasks = sorted((self.task_map[i] for i in ids if i in self.task_map), key=Task.sort_key)
+            if dated:
+                tasks = [
+                    t for t in tasks
+                    if t.date_ord is not None
+                    and (low is None or t.date_ord >= low)
+                    and (high is None or t.date_ord <= high)
+                ]
+        elif dated:
+            tasks = self.task_index.between(low, high)
+        elif completed:
+            return self.task_index.completed_tasks()
+        else:
+            tasks = self.task_index.between(undated=True)
+        
+        if completed is not None:
+            tasks = [t for t in tasks if bool(t.completed) == completed]
+        if priority is not None:
+            tasks = [t for t in tasks if t.priority == priority]
+        return tasks
+
+    def prepare_write(self):
+        """Return a callable doing any pending file I/O, or None"""
+        return None
+
+    def request_write(self):
+        if self.saver is not None:
+            self.saver.schedule()
+        else:
+            self.flush()
+
+    def flush(self):
+        job = self.prepare_write()
+        if job is not None:
+            job()
+
+    def close(self):
+        self.save()
+
+
+class JournalStore(DataStore):
+    """Snapshot file plus an append-only journal of single-record changes"""
+
+    def __init__(self, path=DATA_FILE, journal_path=JOURNAL_FILE, compact_after=500):
+        super().__init__()
+        self.path = path
+        self.journal_path = journal_path
+        self.compact_after = compact_after
+        # Sequence number of the last change, stored in both files so a
+        # journal left behind by an interrupted compaction is not replayed twice
+        self.seq = 0
+        # Token of the session that made the last change, and of this one.
+        # A crash can lose the journal's tail and let seq numbers be reused
+        # for other changes, but never under the same session token.
+        self.generation = None
+        self.session = new_record_id()
+        self.journal_entries = 0
+        # Journal lines not yet written, and whether a snapshot was requested
+        self.pending = []
+        self.snapshot_due = False
+
+    @property
+    def revision(self):
+        if self.generation is None:
+            return None
+        return f"{self.generation}-{self.seq}"
+
+    def load(self):
+        """Read the snapshot and replay the journal tail on top of it"""
+        self.reset()
+        self.seq = 0
+        self.generation = None
+        self.session = new_record_id()
+        self.journal_entries = 0
+        backfilled = False
+        
+        if os.path.exists(self.path):
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            for kind in ('tasks', 'goals'):
+                for item in data.get(kind, []):
+                    backfilled |= self.put(kind, RECORD_TYPES[kind].from_dict(item))
+            self.seq = data.get('seq', 0)
+            self.generation = data.get('gen')
+        
+        torn = False
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path, 'r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A crash mid-append can leave a partial last line
+                        torn = True
+                        break
+                    self.journal_entries += 1
+                    if entry.get('seq', 0) > self.seq:
+                        backfilled |= self.apply(entry)
+                        self.seq = entry['seq']
+                        self.generation = entry.get('gen')
+        
+        # Persist ids given to legacy records before any change refers to
+        # them, and replace a torn journal before anything is appended to it
+        if backfilled or torn:
+            if backfilled:
+                self.generation = self.session
+            self.snapshot_due = True
+            self.flush()
+        self.notify('load')
+
+    def apply(self, entry):
+        op = entry['op']
+        if op == 'clear':
+            self.reset()
+            return False
+        
+        kind = entry['kind']
+        records = self.records(kind)
+        if op == 'add':
+            return self.put(kind, RECORD_TYPES[kind].from_dict(entry['record']))
+        
+        # Journals written before records had ids address them by position
+        record_id = entry['id'] if 'id' in entry else list(records)[entry['index']]
+        if op == 'update':
+            record = RECORD_TYPES[kind].from_dict(entry['record'])
+            record.id = record_id
+            records[record_id] = record
+        elif op == 'delete':
+            records.pop(record_id, None)
+        return False
+
+    # Each change is journaled before observers hear of it, so a failing
+    # observer can't leave a change on screen that was never written
+
+    def add(self, kind, record):
+        self.put(kind, record)
+        self.append({'op': 'add', 'kind': kind, 'record': record.to_dict()})
+        self.notify('add', kind, record)
+        return record
+
+    def update(self, kind, record_id, **fields):
+        record, old = self.update_record(kind, record_id, fields)
+        self.append({'op': 'update', 'kind': kind, 'id': record_id, 'record': record.to_dict()})
+        self.notify('update', kind, record, old)
+        return record
+
+    def remove(self, kind, record_id):
+        record = self.records(kind).pop(record_id)
+        self.append({'op': 'delete', 'kind': kind, 'id': record_id})
+        self.notify('remove', kind, record)
+        return record
+
+    def clear(self):
+        self.reset()
+        self.append({'op': 'clear'})
+        self.notify('clear')
+
+    def append(self, entry):
+        self.seq += 1
+        self.generation = self.session
+        entry['seq'] = self.seq
+        entry['gen'] = self.session
+        self.pending.append(json.dumps(entry) + '\n')
+        self.journal_entries += 1
+        
+        if self.journal_entries >= self.compact_after:
+            self.snapshot_due = True
+        self.request_write()
+
+    def save(self):
+        """Write a full snapshot and truncate the journal"""
+        self.snapshot_due = True
+        self.request_write()
+
+    def close(self):
+        self.snapshot_due = True
+        if self.saver is not None:
+            self.saver.flush()
+        else:
+            self.flush()
+
+    def prepare_write(self):
+        # Runs on the caller's thread; the returned job only touches copies
+        if self.snapshot_due:
+            data = {
+                'tasks': [t.to_dict() for t in self.tasks],
+                'goals': [g.to_dict() for g in self.goals],
+                'seq': self.seq,
+                'gen': self.generation
+            }
+            self.pending = []
+            self.snapshot_due = False
+            self.journal_entries = 0
+            return lambda: self.write_snapshot(data)
+        
+        if self.pending:
+            lines = self.pending
+            self.pending = []
+            return lambda: self.write_journal(lines)
+        return None
+
+    def write_snapshot(self, data):
+        write_json_atomic(self.path, data)
+        # The snapshot already holds every journaled change up to data['seq']
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+
+    def write_journal(self, lines):
+        with open(self.journal_path, 'a') as f:
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class SqliteRecords:
+    """Read-only id -> record mapping over one SQLite table
+
+    Records are parsed from their row on each access rather than kept, so
+    memory doesn't grow with the table.
+    """
+
+    def __init__(self, store, kind):
+        self.store = store
+        self.kind = kind
+
+    def parse(self, data):
+        return RECORD_TYPES[self.kind].from_dict(json.loads(data))
+
+    def __getitem__(self, record_id):
+        row = self.store.execute(f"SELECT data FROM {self.kind} WHERE uid = ?", (record_id,)).fetchone()
+        if row is None:
+            raise KeyError(record_id)
+        return self.parse(row[0])
+
+    def get(self, record_id, default=None):
+        try:
+            return self[record_id]
+        except KeyError:
+            return default
+
+    def __contains__(self, record_id):
+        return self.store.execute(
+            f"SELECT 1 FROM {self.kind} WHERE uid = ?", (record_id,)
+        ).fetchone() is not None
+
+    def __len__(self):
+        return self.store.execute(f"SELECT COUNT(*) FROM {self.kind}").fetchone()[0]
+
+    def __iter__(self):
+        rows = self.store.execute(f"SELECT uid FROM {self.kind} ORDER BY id").fetchall()
+        return (uid for (uid,) in rows)
+
+    def values(self):
+        rows = self.store.execute(f"SELECT data FROM {self.kind} ORDER BY id")
+        return (self.parse(data) for (data,) in rows)
+
+
+class SqliteStats:
+    """The stat card counts, answered by indexed queries on the SQLite tables"""
+
+    def __init__(self, store):
+        self.store = store
+        self.today = date.today().toordinal()
+
+    def count(self, sql, *args):
+        return self.store.execute(sql, args).fetchone()[0]
+
+    @property
+    def tasks_total(self):
+        return self.count("SELECT COUNT(*) FROM tasks")
+
+    @property
+    def tasks_completed(self):
+        return self.count("SELECT COUNT(*) FROM tasks WHERE completed = 1")
+
+    @property
+    def goals_total(self):
+        return self.count("SELECT COUNT(*) FROM goals")
+
+    @property
+    def goals_completed(self):
+        return self.count("SELECT COUNT(*) FROM goals WHERE completed = 1")
+
+    @property
+    def categories(self):
+        return dict(self.store.execute(
+            "SELECT COALESCE(NULLIF(category, ''), 'Uncategorized'), COUNT(*) FROM goals GROUP BY 1"
+        ).fetchall())
+
+    def roll_to(self, today):
+        self.today = today
+
+    def current_day(self):
+        return self.today
+
+    def due_today(self):
+        return self.count("SELECT COUNT(*) FROM tasks WHERE date = ?", date.fromordinal(self.today).isoformat())
+
+    def overdue(self):
+        # The lower bound leaves out empty dates, which sort before real ones
+        return self.count(
+            "SELECT COUNT(*) FROM tasks WHERE date < ? AND date >= '0001-01-01' AND completed = 0",
+            date.fromordinal(self.today).isoformat()
+        )
+
+    def this_week(self):
+        monday = self.today - date.fromordinal(self.today).weekday()
+        return self.count(
+            "SELECT COUNT(*) FROM tasks WHERE date BETWEEN ? AND ?",
+            date.fromordinal(monday).isoformat(), date.fromordinal(monday + 6).isoformat()
+        )
+
+    def goals_active(self):
+        return self.goals_total - self.goals_completed
+
+    def completion_rate(self):
+        total = self.tasks_total
+        return round((self.tasks_completed / total * 100) if total > 0 else 0)
+
+
+class SqliteStore(DataStore):
+    """Tasks and goals in indexed SQLite tables, read on demand
+
+    Nothing is loaded up front: find_tasks and the stat cards run indexed
+    queries on the date, completed, priority and category columns, and
+    records are parsed from their rows as they are asked for. A revision
+    token stored with each change lets the search index and rollup reuse
+    their saved copies instead of reading every row at startup.
+    
+    Changes run as SQL on the Tk thread, where the same connection sees them
+    before they are committed; WriteBehindSaver batches them into one commit
+    on its thread. The lock keeps the two threads off the connection at the
+    same time, so a query can wait for a commit in progress.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            uid TEXT,
+            date TEXT,
+            completed INTEGER NOT NULL DEFAULT 0,
+            priority TEXT,
+            category TEXT,
+            data TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS goals (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            uid TEXT,
+            target_date TEXT,
+            completed INTEGER NOT NULL DEFAULT 0,
+            category TEXT,
+            data TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+    """
+
+    INDEXES = """
+        CREATE UNIQUE INDEX IF NOT EXISTS tasks_uid ON tasks (uid);
+        CREATE UNIQUE INDEX IF NOT EXISTS goals_uid ON goals (uid);
+        CREATE INDEX IF NOT EXISTS tasks_date ON tasks (date);
+        CREATE INDEX IF NOT EXISTS tasks_completed ON tasks (completed);
+        CREATE INDEX IF NOT EXISTS tasks_priority ON tasks (priority);
+        CREATE INDEX IF NOT EXISTS tasks_category ON tasks (category);
+        CREATE INDEX IF NOT EXISTS goals_completed ON goals (completed);
+        CREATE INDEX IF NOT EXISTS goals_category ON goals (category);
+    """
+
+    def __init__(self, path=DB_FILE, migrate_from=DATA_FILE):
+        super().__init__()
+        self.path = path
+        self.migrate_from = migrate_from
+        self.conn = None
+        self.revision = None
+        self.lock = threading.Lock()
+        # Whether changes are waiting for a commit
+        self.uncommitted = False
+
+    def reset(self):
+        self.task_map = SqliteRecords(self, 'tasks')
+        self.goal_map = SqliteRecords(self, 'goals')
+
+    def create_indexes(self):
+        self.stats = SqliteStats(self)
+
+    def connect(self):
+        if self.conn is None:
+            self.conn = sqlite3.connect(self.path, check_same_thread=False)
+            self.conn.executescript(self.SCHEMA)
+            # Databases created before records had ids lack the uid column
+            for kind in ('tasks', 'goals'):
+                columns = [row[1] for row in self.conn.execute(f"PRAGMA table_info({kind})")]
+                if 'uid' not in columns:
+                    self.conn.execute(f"ALTER TABLE {kind} ADD COLUMN uid TEXT")
+            self.conn.executescript(self.INDEXES)
+
+    def execute(self, sql, args=()):
+        self.connect()
+        with self.lock:
+            return self.conn.execute(sql, args)
+
+    def load(self):
+        new_database = not os.path.exists(self.path)
+        self.connect()
+        if new_database and self.migrate_from:
+            migrate_json_to_sqlite(self.migrate_from, self)
+        
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'revision'").fetchone()
+        self.revision = row[0] if row is not None else None
+        
+        # Only rows written before records had ids are read, to give them one
+        for kind in ('tasks', 'goals'):
+            rows = self.conn.execute(f"SELECT id, data FROM {kind} WHERE uid IS NULL").fetchall()
+            for row_id, data in rows:
+                record = RECORD_TYPES[kind].from_dict(json.loads(data))
+                if not record.id:
+                    record.id = new_record_id()
+                self.conn.execute(
+                    f"UPDATE {kind} SET uid = ?, data = ? WHERE id = ?",
+                    (record.id, json.dumps(record.to_dict()), row_id)
+                )
+            if rows:
+                self.revise()
+        if self.revision is None:
+            self.revise()
+        self.conn.commit()
+        self.notify('load')
+
+    def revise(self):
+        """Give the data a new revision token, in the same transaction as the change"""
+        self.revision = new_record_id()
+        self.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('revision', ?)", (self.revision,))
+
+    def find_tasks(self, date=None, after=None, before=None, completed=None, ids=None,
+                   priority=None):
+        where = []
+        args = []
+        if date is not None:
+            if parse_date_ordinal(date) is None:
+                return []
+            where.append("date = ?")
+            args.append(date)
+        if after is not None:
+            where.append("date > ?")
+            args.append(after)
+        if before is not None:
+            where.append("date < ?")
+            args.append(before)
+        if completed is not None:
+            where.append("completed = ?")
+            args.append(1 if completed else 0)
+        if priority is not None:
+            where.append("priority = ?")
+            args.append(priority)
+        
+        sql = "SELECT data FROM tasks"
+        if ids is None:
+            if where:
+                sql += " WHERE " + " AND ".join(where)
+            rows = self.execute(sql, args).fetchall()
+        else:
+            # A few hundred ids per query, under SQLite's parameter limit
+            ids = list(ids)
+            rows = []
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                clauses = where + [f"uid IN ({', '.join('?' * len(chunk))})"]
+                rows += self.execute(sql + " WHERE " + " AND ".join(clauses), args + chunk).fetchall()
+        
+        tasks = [Task.from_dict(json.loads(data)) for (data,) in rows]
+        if date is not None or after is not None or before is not None:
+            # Text comparison lets through empty and malformed dates
+            tasks = [t for t in tasks if t.date_ord is not None]
+        tasks.sort(key=Task.sort_key)
+        return tasks
+
+    def columns(self, kind, record):
+        completed = 1 if record.completed else 0
+        if kind == 'tasks':
+            return {
+                'uid': record.id,
+                'date': record.date,
+                'completed': completed,
+                'priority': record.priority,
+                'category': record.category,
+                'data': json.dumps(record.to_dict())
+            }
+        return {
+            'uid': record.id,
+            'target_date': record.target_date,
+            'completed': completed,
+            'category': record.category,
+            'data': json.dumps(record.to_dict())
+        }
+
+    def insert(self, kind, record):
+        columns = self.columns(kind, record)
+        self.execute(
+            f"INSERT INTO {kind} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            list(columns.values())
+        )
+
+    def add(self, kind, record):
+        if not record.id:
+            record.id = new_record_id()
+        self.insert(kind, record)
+        self.changed()
+        self.notify('add', kind, record)
+        return record
+
+    def update(self, kind, record_id, **fields):
+        record, old = self.update_record(kind, record_id, fields)
+        columns = self.columns(kind, record)
+        self.execute(
+            f"UPDATE {kind} SET {', '.join(f'{c} = ?' for c in columns)} WHERE uid = ?",
+            list(columns.values()) + [record_id]
+        )
+        self.changed()
+        self.notify('update', kind, record, old)
+        return record
+
+    def remove(self, kind, record_id):
+        record = self.get(kind, record_id)
+        self.execute(f"DELETE FROM {kind} WHERE uid = ?", (record_id,))
+        self.changed()
+        self.notify('remove', kind, record)
+        return record
+
+    def clear(self):
+        self.execute("DELETE FROM tasks")
+        self.execute("DELETE FROM goals")
+        self.changed()
+        self.notify('clear')
+
+    def changed(self):
+        self.revise()
+        self.uncommitted = True
+        self.request_write()
+
+    def prepare_write(self):
+        if not self.uncommitted:
+            return None
+        self.uncommitted = False
+        return self.commit
+
+    def commit(self):
+        with self.lock:
+            self.conn.commit()
+
+    def save(self):
+        self.uncommitted = True
+        self.request_write()
+
+    def close(self):
+        if self.conn is None:
+            return
+        if self.saver is not None:
+            self.saver.flush()
+        self.commit()
+        self.conn.close()
+        self.conn = None
+
+
+def migrate_json_to_sqlite(json_path, store):
+    """Copy a JSON snapshot and its journal into an empty SQLite store"""
+    source = JournalStore(path=json_path, journal_path=os.path.splitext(json_path)[0] + '.journal')
+    source.load()
+    for kind in ('tasks', 'goals'):
+        for record in source.records(kind).values():
+            store.insert(kind, record)
+    store.conn.commit()
+
+
+class WriteBehindSaver:
+    """Coalesces store writes and runs them on a background thread"""
+
+    def __init__(self, root, store, delay=300, max_wait=2000, on_error=None, logs=()):
+        self.root = root
+        self.store = store
+        # Other writers with a prepare_write(), such as the activity log
+        self.logs = list(logs)
+        self.delay = delay
+        self.max_wait = max_wait
+        self.on_error = on_error
+        self.timer = None
+        self.first_change = None
+        self.polling = False
+        self.jobs = queue.Queue()
+        self.errors = queue.Queue()
+        
+        self.worker = threading.Thread(target=self.run, daemon=True)
+        self.worker.start()
+        store.saver = self
+        for log in self.logs:
+            log.saver = self
+
+    def schedule(self):
+        now = time.monotonic()
+        if self.timer is None:
+            self.first_change = now
+        elif (now - self.first_change) * 1000 < self.max_wait:
+            # Restart the quiet period, but don't postpone a busy burst forever
+            self.root.after_cancel(self.timer)
+        else:
+            return
+        self.timer = self.root.after(self.delay, self.write)
+
+    def write(self):
+        self.timer = None
+        for writer in [self.store] + self.logs:
+            job = writer.prepare_write()
+            if job is not None:
+                self.submit(job)
+
+    def submit(self, job):
+        """Queue a callable for the writer thread, after anything queued before it"""
+        self.jobs.put(job)
+        if not self.polling:
+            self.polling = True
+            self.root.after(100, self.poll_errors)
+
+    def run(self):
+        # Single worker, so journal appends and snapshots land in order
+        while True:
+            job = self.jobs.get()
+            try:
+                job()
+            except Exception as e:
+                self.errors.put(e)
+            finally:
+                self.jobs.task_done()
+
+    def poll_errors(self):
+        self.report_errors()
+        if self.jobs.unfinished_tasks:
+            self.root.after(100, self.poll_errors)
+        else:
+            self.polling = False
+
+    def report_errors(self):
+        while not self.errors.empty():
+            error = self.errors.get_nowait()
+            if self.on_error is not None:
+                self.on_error(error)
+
+    def flush(self):
+        """Write everything pending and wait for the worker to finish"""
+        if self.timer is not None:
+            self.root.after_cancel(self.timer)
+        self.write()
+        self.jobs.join()
+        self.report_errors()
+
+
+class WorkerPool:
+    """Threads for slow work, with results handed back on the Tk thread
+
+    Jobs wait in a priority queue, lowest number first. done(result) and
+    error(exception) always run on the Tk thread, from a queue polled while
+    any job is outstanding.
+    """
+
+    HIGH = 0
+    NORMAL = 10
+    LOW = 20
+
+    def __init__(self, root, threads=2):
+        self.root = root
+        self.jobs = queue.PriorityQueue()
+        self.results = queue.Queue()
+        # Breaks priority ties in submission order
+        self.order = itertools.count()
+        self.outstanding = 0
+        
+        self.workers = [threading.Thread(target=self.run, daemon=True) for _ in range(threads)]
+        for worker in self.workers:
+            worker.start()
+
+    def submit(self, fn, *args, done=None, error=None, priority=NORMAL):
+        """Run fn(*args) off the Tk thread"""
+        self.outstanding += 1
+        if self.outstanding == 1:
+            self.root.after(50, self.poll)
+        self.jobs.put((priority, next(self.order), (fn, args, done, error)))
+
+    def run(self):
+        while True:
+            _, _, job = self.jobs.get()
+            if job is None:
+                return
+            fn, args, done, error = job
+            try:
+                result = fn(*args)
+            except Exception as e:
+                self.results.put((error, e))
+            else:
+                self.results.put((done, result))
+
+    def poll(self):
+        while not self.results.empty():
+            callback, value = self.results.get_nowait()
+            self.outstanding -= 1
+            if callback is not None:
+                callback(value)
+        
+        if self.outstanding:
+            self.root.after(50, self.poll)
+
+    def shutdown(self):
+        """Run the queued jobs to the end and stop the workers"""
+        for _ in self.workers:
+            self.jobs.put((float('inf'), next(self.order), None))
+        # The threads are daemons, so without this exit could cut a job short
+        for worker in self.workers:
+            worker.join()
+
+
+class EmailOutbox:
+    """Email notifications queued on disk and sent as digests in the background
+
+    add() only hands a message to the worker thread, so the Tk loop never
+    waits on disk or network. The worker keeps unsent messages in path,
+    lets a burst gather for BATCH_WINDOW seconds, then sends one digest per
+    recipient over a single SMTP connection it keeps open while mail keeps
+    coming. A failed send is retried with exponential backoff. Each message
+    is saved as soon as the worker takes it, so close() can wait for that
+    and leave whatever is unsent for the next run.
+    """
+
+    BATCH_WINDOW = 2
+    # Seconds an unused connection stays open
+    IDLE_CLOSE = 60
+    RETRY_FIRST = 30
+    RETRY_MAX = 60 * 60
+
+    def __init__(self, settings, path=OUTBOX_FILE):
+        self.host = settings.get('smtp_host', 'localhost')
+        self.port = settings.get('smtp_port', 25)
+        self.username = settings.get('smtp_username')
+        self.password = settings.get('smtp_password')
+        self.starttls = settings.get('smtp_starttls', False)
+        self.sender = settings.get('email_from') or 'life-manager@localhost'
+        self.path = path
+        
+        self.incoming = queue.Queue()
+        self.stopping = threading.Event()
+        # Guards messages and the file, shared with close() on the Tk thread
+        self.lock = threading.Lock()
+        self.messages = []
+        # Day the last overdue digest was queued for, kept with the messages
+        self.overdue_day = None
+        self.load()
+        self.smtp = None
+        self.failures = 0
+        self.retry_at = 0
+        self.last_error = None
+        
+        self.worker = threading.Thread(target=self.run, daemon=True)
+        self.worker.start()
+
+    def add(self, to, subject, body):
+        self.incoming.put({'to': to, 'subject': subject, 'body': body, 'queued': int(time.time())})
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except ValueError:
+            return
+        self.messages = data.get('messages', [])
+        self.overdue_day = data.get('overdue_day')
+
+    def save(self):
+        write_json_atomic(self.path, {'messages': self.messages, 'overdue_day': self.overdue_day})
+
+    def take_incoming(self, taken=None):
+        """Move handed-over messages into the saved queue"""
+        taken = taken or []
+        while True:
+            try:
+                taken.append(self.incoming.get_nowait())
+            except queue.Empty:
+                break
+        # None only wakes the worker to stop
+        added = [message for message in taken if message is not None]
+        try:
+            if added:
+                with self.lock:
+                    self.messages.extend(added)
+                    self.save()
+        finally:
+            for _ in taken:
+                self.incoming.task_done()
+        return bool(added)
+
+    def run(self):
+        while not self.stopping.is_set():
+            if self.messages:
+                timeout = max(0, self.retry_at - time.time())
+            elif self.smtp is not None:
+                timeout = self.IDLE_CLOSE
+            else:
+                timeout = None
+            try:
+                added = [self.incoming.get(timeout=timeout)]
+            except queue.Empty:
+                if not self.messages:
+                    self.disconnect()
+                    continue
+                added = []
+            
+            try:
+                # Saved before the wait, so closing meanwhile loses nothing
+                if self.take_incoming(added) and not self.stopping.is_set():
+                    # A burst of adds becomes one digest rather than one each
+                    time.sleep(self.BATCH_WINDOW)
+                    self.take_incoming()
+            except OSError as e:
+                self.last_error = str(e)
+            if self.messages and time.time() >= self.retry_at and not self.stopping.is_set():
+                self.send_all()
+        self.disconnect()
+
+    def send_all(self):
+        with self.lock:
+            batch = list(self.messages)
+        by_recipient = {}
+        for message in batch:
+            by_recipient.setdefault(message['to'], []).append(message)
+        
+        try:
+            smtp = self.connect()
+            for to, messages in by_recipient.items():
+                smtp.send_message(self.digest(to, messages))
+                sent = {id(m) for m in messages}
+                with self.lock:
+                    self.messages = [m for m in self.messages if id(m) not in sent]
+                    self.save()
+        except (smtplib.SMTPException, OSError) as e:
+            self.disconnect()
+            self.failures += 1
+            self.retry_at = time.time() + min(self.RETRY_FIRST * 2 ** (self.failures - 1), self.RETRY_MAX)
+            self.last_error = str(e)
+        else:
+            self.failures = 0
+            self.retry_at = 0
+            self.last_error = None
+
+    def connect(self):
+        """The open connection if the server still answers, else a new one"""
+        if self.smtp is not None:
+            try:
+                if self.smtp.noop()[0] == 250:
+                    return self.smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self.disconnect()
+        
+        smtp = smtplib.SMTP(self.host, self.port, timeout=30)
+        try:
+            if self.starttls:
+                smtp.starttls()
+            if self.username:
+                smtp.login(self.username, self.password or '')
+        except Exception:
+            smtp.close()
+            raise
+        self.smtp = smtp
+        return smtp
+
+    def disconnect(self):
+        if self.smtp is not None:
+            try:
+                self.smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                self.smtp.close()
+            self.smtp = None
+
+    def digest(self, to, messages):
+        email = EmailMessage()
+        email['From'] = self.sender
+        email['To'] = to
+        if len(messages) == 1:
+            email['Subject'] = messages[0]['subject']
+        else:
+            email['Subject'] = f"Life Manager: {len(messages)} notifications"
+        email.set_content('\n\n'.join(f"{m['subject']}\n{m['body']}" for m in messages))
+        return email
+
+    def status(self):
+        queued = len(self.messages) + self.incoming.qsize()
+        if self.last_error:
+            return f"{queued} queued, retrying"
+        return f"{queued} queued" if queued else "Idle"
+
+    def close(self):
+        """Save everything queued and stop the worker; unsent mail waits for the next run"""
+        self.take_incoming()
+        # A message the worker just took is marked done only once it's saved
+        self.incoming.join()
+        self.stopping.set()
+        self.incoming.put(None)
+
+
+STORAGE_BACKENDS = {
+    'json': JournalStore,
+    'sqlite': SqliteStore
+}
+
+
+class TaskRow:
+    """A task card that can be pointed at a different task when recycled"""
+
+    HEIGHT = 100
+    PADX = 10
+    PADY = 5
+
+    def __init__(self, parent, app):
+        self.app = app
+        self.task = None
+        
+        self.frame = ttb.Frame(parent, height=self.HEIGHT - 2 * self.PADY, relief="solid", borderwidth=1)
+        self.frame.pack_propagate(False)  # Maintain fixed height
+        
+        # Left border color indicator
+        self.indicator = tk.Canvas(self.frame, width=4, highlightthickness=0)
+        self.indicator.pack(side=LEFT, fill=Y)
+        self.bar = self.indicator.create_rectangle(0, 0, 10, 500, outline="")
+        
+        self.content = ttb.Frame(self.frame, padding=10)
+        self.content.pack(side=LEFT, fill=BOTH, expand=YES)
+        
+        self.title = ttb.Label(self.content, font=("Helvetica", 12, "bold"), anchor="w")
+        self.title.pack(anchor=W, pady=(0, 5))
+        
+        # Packed only for tasks with a description
+        self.description = ttb.Label(self.content, bootstyle="secondary", anchor="w")
+        
+        self.info_frame = ttb.Frame(self.content)
+        self.info_frame.pack(fill=X, pady=(5, 0), anchor=W)
+        
+        self.time_label = ttb.Label(self.info_frame, bootstyle="secondary", font=("Helvetica", 10))
+        self.time_label.pack(side=LEFT)
+        
+        self.priority_label = ttb.Label(self.info_frame, bootstyle="secondary", font=("Helvetica", 10))
+        
+        btn_frame = ttb.Frame(self.frame)
+        btn_frame.pack(side=RIGHT, padx=10, fill=Y)
+        
+        self.complete_btn = ttb.Button(
+            btn_frame,
+            text="Complete",
+            bootstyle="success-outline",
+            command=lambda: self.app.complete_task(self.task.id),
+            width=9
+        )
+        
+        self.delete_btn = ttb.Button(
+            btn_frame,
+            text="Delete",
+            bootstyle="danger-outline",
+            command=lambda: self.app.delete_task(self.task.id),
+            width=9
+        )
+        self.delete_btn.pack(side=TOP, pady=5)
+        
+        # Make entire task clickable for details
+        for widget in [self.frame, self.content, self.title, self.info_frame]:
+            widget.bind("<Button-1>", lambda e: self.app.show_task_details(self.task))
+            widget.bind("<Enter>", lambda e: self.app.on_task_hover(self.frame, True))
+            widget.bind("<Leave>", lambda e: self.app.on_task_hover(self.frame, False))
+
+    def show(self, task):
+        self.task = task
+        priority = task.priority or 'Medium'
+        completed = bool(task.completed)
+        
+        # Set color based on priority and completion status
+        if completed:
+            border_color = "#888888"
+        elif priority == "High":
+            border_color = "#e74c3c"
+        elif priority == "Medium":
+            border_color = "#f39c12"
+        else:  # Low
+            border_color = "#3498db"
+        self.indicator.itemconfigure(self.bar, fill=border_color)
+        
+        title_text = task.title or 'Untitled Task'
+        if completed:
+            title_text = "✓ " + title_text
+        self.title.configure(text=title_text, bootstyle="secondary" if completed else "default")
+        
+        description = (task.description or '').strip()
+        if description:
+            self.description.configure(text=description[:75] + ('...' if len(description) > 75 else ''))
+            self.description.pack(anchor=W, fill=X, before=self.info_frame)
+        else:
+            self.description.pack_forget()
+        
+        time_str = task.time or ''
+        if task.time_min is not None:
+            time_str = format_minutes(task.time_min)
+        self.time_label.configure(text=time_str)
+        
+        if completed:
+            self.priority_label.pack_forget()
+            self.complete_btn.pack_forget()
+        else:
+            self.priority_label.configure(text=f"• {priority} Priority")
+            self.priority_label.pack(side=LEFT, padx=(10, 0))
+            self.complete_btn.pack(side=TOP, pady=5, before=self.delete_btn)
+
+
+class DateHeaderRow:
+    """A recyclable date heading between groups of task rows"""
+
+    HEIGHT = 56
+    PADX = 0
+    PADY = 0
+
+    def __init__(self, parent, app):
+        self.frame = ttb.Frame(parent, height=self.HEIGHT)
+        self.frame.pack_propagate(False)
+        
+        self.label = ttb.Label(self.frame, font=("Helvetica", 12, "bold"), bootstyle="secondary")
+        self.label.pack(anchor=W, padx=5, pady=(15, 5))
+        
+        ttb.Separator(self.frame).pack(fill=X, padx=5, pady=5)
+
+    def show(self, text):
+        self.label.configure(text=text)
+
+
+class VirtualTaskList(ttb.Frame):
+    """Scrollable task list that only builds widgets for rows near the viewport
+
+    Rows are ('header', text) or ('task', task) pairs with fixed heights. A pool
+    of row widgets is placed on a canvas and re-pointed at new rows as the view
+    scrolls, so widget count follows the window height, not the task count.
+    """
+
+    ROW_TYPES = {'header': DateHeaderRow, 'task': TaskRow}
+    OVERSCAN = 3
+
+    def __init__(self, parent, app):
+        super().__init__(parent)
+        self.app = app
+        self.rows = []
+        self.offsets = []
+        # What the rows answer, so new data for the same query keeps the scroll
+        self.query = None
+        # Pooled row objects, and the free ones per row type
+        self.pool = []
+        self.free = {kind: [] for kind in self.ROW_TYPES}
+        # Row index -> pooled row currently showing it
+        self.shown = {}
+        self.empty = None
+        
+        self.scrollbar = ttb.Scrollbar(self, orient=VERTICAL)
+        self.scrollbar.pack(side=RIGHT, fill=Y)
+        self.canvas = tk.Canvas(self, highlightthickness=0, yscrollincrement=20)
+        self.canvas.pack(side=LEFT, fill=BOTH, expand=YES)
+        self.scrollbar.configure(command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self.on_scroll)
+        
+        self.canvas.bind("<Configure>", self.on_resize)
+        self.bind_wheel(self.canvas)
+
+    def bind_wheel(self, widget):
+        widget.bind("<MouseWheel>", self.on_wheel)
+        widget.bind("<Button-4>", self.on_wheel)
+        widget.bind("<Button-5>", self.on_wheel)
+        for child in widget.winfo_children():
+            self.bind_wheel(child)
+
+    def on_wheel(self, event):
+        step = -3 if event.num == 4 or event.delta > 0 else 3
+        self.canvas.yview_scroll(step, "units")
+
+    def on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self.refresh()
+
+    def on_resize(self, event):
+        for row in self.pool:
+            self.canvas.itemconfigure(row.window, width=event.width - 2 * row.PADX)
+        if self.empty is not None:
+            self.canvas.itemconfigure(self.empty_window, width=event.width)
+        self.refresh()
+
+    def set_rows(self, rows, query=None):
+        """Show rows, back at the top only if query differs from the last one"""
+        for index in list(self.shown):
+            self.release(index)
+        self.rows = rows
+        self.offsets = []
+        height = 0
+        for kind, _ in rows:
+            self.offsets.append(height)
+            height += self.ROW_TYPES[kind].HEIGHT
+        self.canvas.configure(scrollregion=(0, 0, 0, height))
+        self.show_empty(not rows)
+        if query != self.query:
+            self.query = query
+            self.canvas.yview_moveto(0)
+        self.refresh()
+
+    def refresh(self):
+        """Show the rows overlapping the viewport and recycle the rest"""
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        start = max(bisect.bisect_right(self.offsets, top) - 1 - self.OVERSCAN, 0)
+        stop = min(bisect.bisect_left(self.offsets, bottom) + self.OVERSCAN, len(self.rows))
+        
+        for index in [i for i in self.shown if not start <= i < stop]:
+            self.release(index)
+        for index in range(start, stop):
+            if index not in self.shown:
+                self.place(index)
+
+    def place(self, index):
+        kind, value = self.rows[index]
+        free = self.free[kind]
+        if free:
+            row = free.pop()
+        else:
+            row = self.ROW_TYPES[kind](self.canvas, self.app)
+            row.kind = kind
+            row.window = self.canvas.create_window(
+                0, 0, window=row.frame, anchor="nw",
+                width=self.canvas.winfo_width() - 2 * row.PADX,
+                height=row.HEIGHT - 2 * row.PADY
+            )
+            self.bind_wheel(row.frame)
+            self.pool.append(row)
+        row.show(value)
+        self.canvas.coords(row.window, row.PADX, self.offsets[index] + row.PADY)
+        self.canvas.itemconfigure(row.window, state="normal")
+        self.shown[index] = row
+
+    def release(self, index):
+        row = self.shown.pop(index)
+        self.canvas.itemconfigure(row.window, state="hidden")
+        self.free[row.kind].append(row)
+
+    def show_empty(self, empty):
+        if self.empty is None:
+            if not empty:
+                return
+            self.empty = ttb.Frame(self.canvas)
+            
+            # No tasks message with icon
+            ttb.Label(
+                self.empty,
+                text="No tasks found",
+                font=("Helvetica", 14),
+                bootstyle="secondary"
+            ).pack(pady=(70, 20))
+            
+            # Add suggestion
+            ttb.Label(
+                self.empty,
+                text="Click on '+ New Task' to create a task",
+                font=("Helvetica", 11),
+                bootstyle="secondary"
+            ).pack()
+            self.empty_window = self.canvas.create_window(
+                0, 0, window=self.empty, anchor="nw", width=self.canvas.winfo_width()
+            )
+        self.canvas.itemconfigure(self.empty_window, state="normal" if empty else "hidden")
+
+
+class TimerJob:
+    """A callback for TimerWheel, with its interval per window state"""
+
+    def __init__(self, callback, intervals, repeat):
+        self.callback = callback
+        # Seconds between runs, keyed by window state; None pauses the job
+        self.intervals = intervals
+        self.repeat = repeat
+        self.last = time.monotonic()
+
+    def due(self, state):
+        interval = self.intervals[state]
+        return None if interval is None else self.last + interval
+
+
+class TimerWheel:
+    """One Tk timer shared by every periodic and one-shot job in the app
+
+    The timer is armed for the earliest due job only. Periodic jobs can run
+    less often while the window is unfocused and stop while it's iconified;
+    a paused job runs as soon as the window comes back if it fell due. There
+    are only a handful of jobs, so they are kept in a list and scanned.
+    """
+
+    # Passed as an interval to stop a job while in that state
+    PAUSE = 0
+
+    def __init__(self, root):
+        self.root = root
+        self.jobs = []
+        self.timer = None
+        self.state = 'active'
+        self.checking = False
+        for sequence in ("<Map>", "<Unmap>", "<FocusIn>", "<FocusOut>"):
+            root.bind(sequence, self.on_window_event, add="+")
+
+    def every(self, interval, callback, unfocused=None, hidden=None):
+        """Run callback every interval ms, or as given while unfocused or hidden"""
+        intervals = {}
+        for state, value in (('active', interval), ('unfocused', unfocused), ('hidden', hidden)):
+            value = interval if value is None else value
+            intervals[state] = None if value == self.PAUSE else value / 1000
+        return self.add(TimerJob(callback, intervals, True))
+
+    def after(self, delay, callback):
+        """Run callback once after delay ms, whatever the window is doing"""
+        delay = delay / 1000
+        return self.add(TimerJob(callback, dict.fromkeys(('active', 'unfocused', 'hidden'), delay), False))
+
+    def add(self, job):
+        self.jobs.append(job)
+        self.arm()
+        return job
+
+    def cancel(self, job):
+        if job in self.jobs:
+            self.jobs.remove(job)
+            self.arm()
+
+    def arm(self):
+        if self.timer is not None:
+            self.root.after_cancel(self.timer)
+            self.timer = None
+        dues = [due for due in (job.due(self.state) for job in self.jobs) if due is not None]
+        if dues:
+            # Rounded up, so the timer never wakes just short of the job
+            delay = max(0, math.ceil((min(dues) - time.monotonic()) * 1000))
+            self.timer = self.root.after(delay, self.tick)
+
+    def tick(self):
+        self.timer = None
+        now = time.monotonic()
+        try:
+            for job in list(self.jobs):
+                due = job.due(self.state)
+                if due is None or due > now + 0.001:
+                    continue
+                if job.repeat:
+                    job.last = now
+                else:
+                    self.jobs.remove(job)
+                job.callback()
+        finally:
+            self.arm()
+
+    def on_window_event(self, event):
+        # Focus moves between the app's own widgets fire these too, so the
+        # state is worked out once things settle
+        if not self.checking:
+            self.checking = True
+            self.root.after_idle(self.check_state)
+
+    def check_state(self):
+        self.checking = False
+        if self.root.state() in ('iconic', 'withdrawn'):
+            state = 'hidden'
+        else:
+            try:
+                focused = self.root.focus_get() is not None
+            except KeyError:
+                # Raised for a few ttk popdowns, which only exist with focus
+                focused = True
+            state = 'active' if focused else 'unfocused'
+        if state != self.state:
+            self.state = state
+            self.arm()
+
+
+class Clock:
+    """Today's date and its neighbours, worked out once a day
+
+    Holds today as a date, day ordinal and ISO string, with tomorrow and this
+    week's Monday-to-Sunday bounds as ordinals, so per-task checks are
+    integer comparisons. Once started, a single timer fires at midnight,
+    updates the values and calls each subscriber with the clock.
+    """
+
+    # Longest single sleep, as the monotonic clock stands still during suspend
+    MAX_SLEEP = 60 * 60
+
+    def __init__(self, timers):
+        self.timers = timers
+        self.subscribers = []
+        self.timer = None
+        self.set_day(date.today())
+
+    def set_day(self, day):
+        self.date = day
+        self.today = day.toordinal()
+        self.iso = day.isoformat()
+        self.tomorrow = self.today + 1
+        self.week_start = self.today - day.weekday()
+        self.week_end = self.week_start + 6
+
+    def subscribe(self, callback):
+        self.subscribers.append(callback)
+
+    def start(self):
+        now = datetime.now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        # A little past midnight, so the new date is certain to have arrived
+        delay = int((midnight - now).total_seconds() * 1000) + 500
+        # Waking early is harmless: rollover checks the date and sleeps again
+        delay = min(delay, self.MAX_SLEEP * 1000)
+        self.timer = self.timers.after(delay, self.rollover)
+
+    def rollover(self):
+        today = date.today()
+        if today != self.date:
+            self.set_day(today)
+            for callback in self.subscribers:
+                callback(self)
+        self.start()
+
+
+class RepaintScheduler:
+    """Collects dirty UI regions and repaints each once per idle pass
+
+    A region is a repaint callable; marking it dirty again before the pass
+    runs is a no-op, so bursts of changes cost one repaint per region.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        # Insertion-ordered repaint callable -> owning page name
+        self.dirty = {}
+        self.pending = None
+
+    def invalidate(self, repaint, owner=None):
+        self.dirty.setdefault(repaint, owner)
+        if self.pending is None:
+            self.pending = self.root.after_idle(self.flush)
+
+    def forget(self, owner):
+        """Drop pending repaints for widgets that are being rebuilt anyway"""
+        for repaint in [r for r, o in self.dirty.items() if o == owner]:
+            del self.dirty[repaint]
+
+    def flush(self):
+        self.pending = None
+        while self.dirty:
+            repaint = next(iter(self.dirty))
+            del self.dirty[repaint]
+            repaint()
+
+
+def prewarm_charts():
+    """Import the charting stack ahead of the first chart, off the UI thread"""
+    importlib.import_module('matplotlib.figure')
+    importlib.import_module('matplotlib.backends.backend_agg')
+
+
+class GradientCache:
+    """Vertical gradient images for page decorations, made once per theme and size
+
+    Images are kept in memory and as PNGs under path. Widths are rounded up
+    to WIDTH_STEP, as a vertical gradient looks the same however far it runs
+    past the edge, so dragging the window rarely needs a new image. Every
+    size is kept; asking for a name with a new theme or colours drops the
+    entries made for the old one.
+    """
+
+    WIDTH_STEP = 256
+
+    def __init__(self, path=None):
+        self.path = path
+        self.images = {}
+
+    def image(self, name, theme, top, bottom, width, height):
+        from PIL import ImageTk
+        
+        width = -(-max(width, 1) // self.WIDTH_STEP) * self.WIDTH_STEP
+        key = (name, theme, top, bottom, width, height)
+        photo = self.images.get(key)
+        if photo is not None:
+            return photo
+        
+        for old in [k for k in self.images if k[0] == name and k[1:4] != key[1:4]]:
+            del self.images[old]
+        
+        prefix = f"{name}-{theme}-{top[1:]}-{bottom[1:]}-"
+        filename = f"{prefix}{width}x{height}.png"
+        image = self.load(filename)
+        if image is None:
+            image = self.render(top, bottom, width, height)
+            self.store(name, prefix, filename, image)
+        photo = self.images[key] = ImageTk.PhotoImage(image)
+        return photo
+
+    def render(self, top, bottom, width, height):
+        from PIL import Image
+        
+        start = [int(top[i:i + 2], 16) for i in (1, 3, 5)]
+        end = [int(bottom[i:i + 2], 16) for i in (1, 3, 5)]
+        column = Image.new('RGB', (1, height))
+        column.putdata([
+            tuple(round(a + (b - a) * row / max(height - 1, 1)) for a, b in zip(start, end))
+            for row in range(height)
+        ])
+        return column.resize((width, height))
+
+    def load(self, filename):
+        from PIL import Image
+        
+        if self.path is None:
+            return None
+        try:
+            image = Image.open(os.path.join(self.path, filename))
+            image.load()
+            return image
+        except OSError:
+            return None
+
+    def store(self, name, prefix, filename, image):
+        # A cache is allowed to fail; the image is still shown
+        if self.path is None:
+            return
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            # Other sizes in this theme stay for the next window size
+            for other in os.listdir(self.path):
+                if other.startswith(name + '-') and not other.startswith(prefix):
+                    os.remove(os.path.join(self.path, other))
+            image.save(os.path.join(self.path, filename))
+        except OSError:
+            pass
+
+
+class StartupTimer:
+    """Milestones in ms from process start to the first painted frame"""
+
+    def __init__(self, started):
+        self.started = started
+        self.marks = []
+
+    def mark(self, name):
+        self.marks.append((name, (time.perf_counter() - self.started) * 1000))
+
+    def total(self):
+        return self.marks[-1][1] if self.marks else 0
+
+    def save(self, path):
+        """Append this start's timings as a JSON line, to spot regressions over time"""
+        with open(path, 'a') as f:
+            f.write(json.dumps({
+                'at': datetime.now().isoformat(timespec='seconds'),
+                'marks': {name: round(ms, 1) for name, ms in self.marks}
+            }) + '\n')
+
+
+class ChartRenderer:
+    """Draws charts with Agg on a worker thread and hands Tk the pixels
+
+    The worker owns the figures of the charts it renders: it applies their
+    data and draws, and the RGBA buffer goes into a PhotoImage through PIL's
+    ImageTk with no PNG round trip. A newer update skips queued renders.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.jobs = queue.Queue()
+        self.results = queue.Queue()
+        # Jobs submitted but not yet collected by poll()
+        self.outstanding = 0
+        
+        self.worker = threading.Thread(target=self.run, daemon=True)
+        self.worker.start()
+
+    def submit(self, chart, data):
+        chart.generation += 1
+        self.jobs.put((chart, data, chart.generation))
+        self.outstanding += 1
+        if self.outstanding == 1:
+            self.root.after(50, self.poll)
+
+    def run(self):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        while True:
+            chart, data, generation = self.jobs.get()
+            if generation != chart.generation:
+                # Overtaken by a newer update before it started
+                self.results.put((chart, data, generation, None, None))
+                continue
+            try:
+                chart.redraw(data)
+                agg = FigureCanvasAgg(chart.figure)
+                agg.draw()
+                buffer = agg.buffer_rgba()
+                size = (buffer.shape[1], buffer.shape[0])
+                self.results.put((chart, data, generation, (size, bytes(buffer)), None))
+            except Exception as e:
+                self.results.put((chart, data, generation, None, e))
+
+    def poll(self):
+        from PIL import Image, ImageTk
+        
+        while not self.results.empty():
+            chart, data, generation, rendered, error = self.results.get_nowait()
+            self.outstanding -= 1
+            if error is not None:
+                chart.show_error(error)
+            elif rendered is not None:
+                size, pixels = rendered
+                image = ImageTk.PhotoImage(Image.frombuffer('RGBA', size, pixels, 'raw', 'RGBA', 0, 1))
+                chart.cache_image(data, image)
+                if generation == chart.generation:
+                    chart.show_image(image)
+        
+        if self.outstanding:
+            self.root.after(50, self.poll)
+
+
+class Chart:
+    """A persistent matplotlib Figure and the Tk widget currently showing it
+
+    update() only touches the artists when the data differs from what is
+    already drawn, and then asks the canvas for a single idle redraw. With a
+    renderer, drawing happens off the Tk thread into a cached image instead.
+    Subclasses draw the data onto the axes in redraw(data).
+    """
+
+    # Rendered images kept per chart, keyed by the data they show
+    CACHE_SIZE = 4
+
+    def __init__(self, figsize, title=None, setup=None, renderer=None):
+        from matplotlib.figure import Figure
+        
+        self.figure = Figure(figsize=figsize, dpi=100)
+        self.ax = self.figure.add_subplot()
+        self.title = title
+        # Extra decoration, re-applied whenever the axes are rebuilt
+        self.setup = setup
+        self.canvas = None
+        self.data = None
+        
+        self.renderer = renderer
+        self.label = None
+        self.images = {}
+        self.generation = 0
+
+    def attach(self, master):
+        """The widget showing the chart in master, made once per live parent"""
+        if self.renderer is not None:
+            return self.attach_image(master)
+        
+        if self.canvas is None or not self.canvas.get_tk_widget().winfo_exists():
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            
+            self.canvas = FigureCanvasTkAgg(self.figure, master=master)
+            self.canvas.draw()
+        return self.canvas.get_tk_widget()
+
+    def attach_image(self, master):
+        if self.label is None or not self.label.winfo_exists():
+            # A blank image of the figure's size keeps the layout steady
+            # until the first render arrives
+            width, height = self.figure.bbox.size
+            self.placeholder = tk.PhotoImage(width=int(width), height=int(height))
+            self.label = ttb.Label(
+                master,
+                image=self.placeholder,
+                text="Rendering chart...",
+                compound="center",
+                bootstyle="secondary"
+            )
+            image = self.images.get(self.data)
+            if image is not None:
+                self.show_image(image)
+        return self.label
+
+    def update(self, data):
+        if data == self.data:
+            return False
+        self.data = data
+        
+        if self.renderer is not None:
+            image = self.images.get(data)
+            if image is None:
+                self.renderer.submit(self, data)
+            else:
+                # Cached; also stops an older render in flight from showing
+                self.generation += 1
+                self.show_image(image)
+            return True
+        
+        self.redraw(data)
+        if self.canvas is not None:
+            self.canvas.draw_idle()
+        return True
+
+    def cache_image(self, data, image):
+        self.images.pop(data, None)
+        self.images[data] = image
+        while len(self.images) > self.CACHE_SIZE:
+            del self.images[next(iter(self.images))]
+
+    def show_image(self, image):
+        if self.label is not None and self.label.winfo_exists():
+            self.label.configure(image=image, text="")
+
+    def show_error(self, error):
+        if self.label is not None and self.label.winfo_exists():
+            self.label.configure(text=f"Failed to render chart: {str(error)}")
+
+    def finish_axes(self):
+        if self.title:
+            self.ax.set_title(self.title)
+        if self.setup is not None:
+            self.setup(self.ax)
+
+    def buffer_bytes(self):
+        width, height = self.figure.bbox.size
+        # The figure's own buffer plus any cached images of the same size
+        return int(width) * int(height) * 4 * (1 + len(self.images))
+
+
+class BarChart(Chart):
+    """Grouped bars; data is (labels, [heights per series])"""
+
+    def __init__(self, figsize, series, title=None, setup=None, renderer=None):
+        super().__init__(figsize, title, setup, renderer)
+        # (label, color) per series
+        self.series = series
+        self.labels = None
+        self.bars = None
+
+    def redraw(self, data):
+        labels, values = data
+        if self.bars is None or labels != self.labels:
+            self.build(labels, values)
+            return
+        
+        # Same bars, new heights
+        for bars, heights in zip(self.bars, values):
+            for bar, height in zip(bars, heights):
+                bar.set_height(height)
+        self.ax.relim()
+        self.ax.autoscale_view()
+
+    def build(self, labels, values):
+        ax = self.ax
+        ax.clear()
+        count = len(self.series)
+        width = 0.8 if count == 1 else 0.35
+        x = range(len(labels))
+        self.bars = []
+        for i, ((name, color), heights) in enumerate(zip(self.series, values)):
+            offset = (i - (count - 1) / 2) * width
+            self.bars.append(ax.bar([p + offset for p in x], heights, width, label=name, color=color))
+        ax.set_xticks(list(x))
+        ax.set_xticklabels(labels)
+        if count > 1:
+            ax.legend()
+        self.labels = labels
+        self.finish_axes()
+
+
+class PieChart(Chart):
+    """Pie with percentage labels; data is (labels, sizes)"""
+
+    START_ANGLE = 90
+
+    def __init__(self, figsize, colors, title=None, setup=None, renderer=None):
+        super().__init__(figsize, title, setup, renderer)
+        self.colors = colors
+        self.labels = None
+        self.wedges = None
+
+    def redraw(self, data):
+        labels, sizes = data
+        total = sum(sizes)
+        if self.wedges is None or labels != self.labels or not total:
+            self.build(labels, sizes)
+            return
+        
+        # Same slices, so swing the wedge angles and move their labels
+        theta = self.START_ANGLE
+        for wedge, text, pct, size in zip(self.wedges, self.texts, self.pcts, sizes):
+            span = 360 * size / total
+            wedge.set_theta1(theta)
+            wedge.set_theta2(theta + span)
+            middle = math.radians(theta + span / 2)
+            x, y = math.cos(middle), math.sin(middle)
+            text.set_position((1.1 * x, 1.1 * y))
+            text.set_horizontalalignment('left' if x > 0 else 'right')
+            pct.set_position((0.6 * x, 0.6 * y))
+            pct.set_text(f"{100 * size / total:.1f}%")
+            theta += span
+
+    def build(self, labels, sizes):
+        ax = self.ax
+        ax.clear()
+        self.labels = labels
+        if not sum(sizes):
+            self.wedges = None
+            ax.text(0.5, 0.5, "No data yet", ha='center', va='center', transform=ax.transAxes)
+            ax.axis('off')
+        else:
+            self.wedges, self.texts, self.pcts = ax.pie(
+                sizes, labels=labels, colors=self.colors, autopct='%1.1f%%', startangle=self.START_ANGLE
+            )
+            ax.axis('equal')
+        self.finish_axes()
+
+
+class ChartEngine:
+    """Owns the app's charts, so each Figure is built once and then reused
+
+    Given a ChartRenderer, charts render off the Tk thread into images.
+    """
+
+    def __init__(self, renderer=None):
+        self.charts = {}
+        self.renderer = renderer
+
+    def bar(self, name, figsize, series, title=None, setup=None):
+        if name not in self.charts:
+            self.charts[name] = BarChart(figsize, series, title, setup, self.renderer)
+        return self.charts[name]
+
+    def pie(self, name, figsize, colors, title=None, setup=None):
+        if name not in self.charts:
+            self.charts[name] = PieChart(figsize, colors, title, setup, self.renderer)
+        return self.charts[name]
+
+    def report(self):
+        """Figure, canvas and buffer counts, to make leaked figures visible"""
+        pyplot = sys.modules.get('matplotlib.pyplot')
+        return {
+            'figures': len(self.charts),
+            'canvases': sum(1 for chart in self.charts.values()
+                            if chart.canvas is not None or chart.label is not None),
+            'buffer_bytes': sum(chart.buffer_bytes() for chart in self.charts.values()),
+            # Anything here was created through pyplot and is never freed
+            'pyplot_figures': len(pyplot.get_fignums()) if pyplot is not None else 0
+        }
+
+    def summary(self):
+        report = self.report()
+        text = f"{report['figures']} figures, {report['buffer_bytes'] / 2**20:.1f} MB"
+        if report['pyplot_figures']:
+            text += f", {report['pyplot_figures']} via pyplot"
+        return text
+
+
+class SearchPipeline:
+    """Debounced search-as-you-type with cancellable, incremental rendering
+
+    request() restarts the debounce window, so a burst of keystrokes runs one
+    search. search(query) returns the results and show(results, first) draws
+    them, clearing on the first call. With a batch size, results are drawn a
+    slice at a time across idle passes, and a newer search drops the rest.
+    """
+
+    def __init__(self, root, query, search, show, delay=150, batch=None):
+        self.root = root
+        self.query = query
+        self.search = search
+        self.show = show
+        self.delay = delay
+        self.batch = batch
+        self.timer = None
+        self.batch_job = None
+        # Bumped per search so overtaken batches know to stop
+        self.generation = 0
+
+    def request(self, *args):
+        if self.timer is not None:
+            self.root.after_cancel(self.timer)
+        self.timer = self.root.after(self.delay, self.run_now)
+
+    def cancel(self):
+        if self.timer is not None:
+            self.root.after_cancel(self.timer)
+            self.timer = None
+        if self.batch_job is not None:
+            self.root.after_cancel(self.batch_job)
+            self.batch_job = None
+        self.generation += 1
+
+    def run_now(self, *args):
+        """Search straight away, overtaking any pending or unfinished search"""
+        self.cancel()
+        results = self.search(self.query())
+        if self.batch is None:
+            self.show(results, True)
+            return
+        
+        # First screenful now, the rest once pending input has been handled
+        self.show(results[:self.batch], True)
+        if len(results) > self.batch:
+            self.batch_job = self.root.after_idle(self.show_batch, results, self.batch, self.generation)
+
+    def show_batch(self, results, start, generation):
+        self.batch_job = None
+        if generation != self.generation:
+            return
+        stop = start + self.batch
+        self.show(results[start:stop], False)
+        if stop < len(results):
+            self.batch_job = self.root.after_idle(self.show_batch, results, stop, generation)
+
 
 class LifeManagerApp:
     def __init__(self, root):
+        # Module imports plus window creation come before this first mark
+        self.startup = StartupTimer(STARTUP_STARTED)
+        self.startup.mark('window')
+        
         self.root = root
         self.root.title("Life Manager Pro")
         self.root.geometry("1200x800")
@@ -21,9 +2993,57 @@ class LifeManagerApp:
         self.style.configure('lefttab.TNotebook', tabposition='wn')
         
         # Initialize data storage
-        self.tasks = []
-        self.goals = []
+        self.settings = self.load_settings()
+        backend = self.settings.get('storage_backend', 'json')
+        self.store = STORAGE_BACKENDS.get(backend, JournalStore)()
+        index_path = SEARCH_INDEX_FILE if self.settings.get('persist_search_index', True) else None
+        self.search_index = SearchIndex(self.store, path=index_path)
+        self.rollup = DailyRollup(self.store, path=ROLLUP_FILE)
+        self.activity = ActivityLog(self.store, path=ACTIVITY_FILE)
+        self.decorations = GradientCache(DECORATION_CACHE_DIR)
+        
+        # Matplotlib figures live as long as the app and are reused per visit;
+        # "background" rendering draws them on a worker thread into images
+        renderer = None
+        if self.settings.get('chart_rendering', 'canvas') == 'background':
+            renderer = ChartRenderer(self.root)
+        self.charts = ChartEngine(renderer)
+        # NumPy columns for the analytics page, made on its first visit
+        self.task_columns = None
+        # Every periodic job, from the header clock to midnight, shares one timer
+        self.timers = TimerWheel(self.root)
+        
+        # Today's date for every view, refreshed by one timer at midnight
+        self.clock = Clock(self.timers)
+        self.clock.subscribe(self.on_new_day)
         self.load_data()
+        self.startup.mark('data loaded')
+        
+        # Write changes in the background once activity settles
+        self.saver = WriteBehindSaver(
+            self.root, self.store, on_error=self.on_save_error, logs=[self.activity]
+        )
+        
+        # Reminders for open tasks and goals, shown as desktop notifications
+        self.reminders = ReminderEngine(
+            self.store, self.timers, self.on_reminder,
+            lead_minutes=self.settings.get('reminder_lead_minutes', 15)
+        )
+        
+        # Slow one-off jobs such as backups run here, reporting back on the Tk thread
+        self.workers = WorkerPool(self.root)
+        
+        # Email goes out through a queued outbox, never from the Tk thread
+        self.outbox = None
+        if self.settings.get('email_notifications') and self.settings.get('email_to'):
+            self.outbox = EmailOutbox(self.settings)
+        
+        # The derived indexes are otherwise only saved on exit
+        self.autosaved = self.store.revision
+        self.timers.every(AUTOSAVE_INTERVAL, self.autosave)
+        
+        # Compact the journal into the snapshot on exit
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
         # Initialize active page
         self.active_page = "dashboard"
@@ -51,9 +3071,145 @@ class LifeManagerApp:
         self.sidebar_content.pack(fill=Y, expand=NO, side=RIGHT, padx=10, pady=10)
         self.sidebar_content.pack_propagate(False)
         
-        # Initialize with dashboard
-        self.show_dashboard()
-        self.update_sidebar_content()
+        # Set once matplotlib is imported; charts wait for it rather than
+        # importing it on the UI thread
+        self.charts_ready = threading.Event()
+        self.charts_loading = False
+        
+        # Pages are built once, then kept hidden and patched as data changes
+        self.pages = {}
+        self.page_watchers = {}
+        self.stale_pages = set()
+        self.repaints = RepaintScheduler(self.root)
+        self.store.subscribe(self.on_store_change)
+        
+        # Initialize with dashboard
+        self.show_dashboard()
+        self.startup.mark('ui built')
+        self.clock.start()
+        
+        # Idle callbacks queued now run after the initial layout and paint
+        self.root.after_idle(self.on_first_frame)
+
+    @property
+    def tasks(self):
+        return self.store.tasks
+
+    @property
+    def goals(self):
+        return self.store.goals
+
+    @property
+    def stats(self):
+        return self.store.stats
+
+    def on_first_frame(self):
+        self.startup.mark('first frame')
+        try:
+            self.startup.save(STARTUP_LOG)
+        except OSError:
+            pass
+        
+        self.send_overdue_digest()
+        
+        # Load the charting stack before anyone opens Analytics
+        if self.settings.get('prewarm_charts', True):
+            self.load_charts()
+
+    def load_charts(self):
+        """Import matplotlib on a background thread, once"""
+        if self.charts_loading:
+            return
+        self.charts_loading = True
+        
+        def load():
+            try:
+                prewarm_charts()
+            finally:
+                self.charts_ready.set()
+        
+        threading.Thread(target=load, daemon=True).start()
+
+    def when_charts_ready(self, callback):
+        """Run callback on the UI thread once matplotlib has been imported"""
+        if self.charts_ready.is_set():
+            callback()
+            return
+        self.load_charts()
+        self.root.after(100, lambda: self.when_charts_ready(callback))
+
+    def autosave(self):
+        if self.store.revision == self.autosaved:
+            return
+        # Copies are taken here; encoding and writing happen on the writer thread
+        try:
+            for writer in (self.search_index, self.rollup):
+                job = writer.prepare_write()
+                if job is not None:
+                    self.saver.submit(job)
+            self.autosaved = self.store.revision
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save data: {str(e)}")
+
+    def on_reminder(self, kind, record):
+        if kind == 'tasks':
+            title = "Task Reminder"
+            when = f"Due {record.date} at {record.time}" if record.time else f"Due {record.date}"
+        else:
+            title = "Goal Reminder"
+            when = f"Target date {record.target_date}"
+        
+        if self.settings.get('desktop_notifications', True):
+            from ttkbootstrap.toast import ToastNotification
+            
+            ToastNotification(
+                title=title,
+                message=f"{record.title}\n{when}",
+                duration=10000,
+                bootstyle="info"
+            ).show_toast()
+        
+        if self.email_enabled():
+            self.outbox.add(self.settings['email_to'], title, f"{record.title}\n{when}")
+
+    def email_enabled(self):
+        return (self.outbox is not None and self.settings.get('email_notifications')
+                and self.settings.get('email_to'))
+
+    def send_overdue_digest(self):
+        """Email every overdue task in one message, at most once a day"""
+        if not self.email_enabled() or self.outbox.overdue_day == self.clock.iso:
+            return
+        self.outbox.overdue_day = self.clock.iso
+        overdue = self.store.find_tasks(before=self.clock.iso, completed=False)
+        if overdue:
+            lines = [f"{task.date}  {task.title}" for task in overdue]
+            self.outbox.add(
+                self.settings['email_to'],
+                f"{len(overdue)} overdue task{'s' if len(overdue) != 1 else ''}",
+                '\n'.join(lines)
+            )
+
+    def on_close(self):
+        try:
+            self.store.close()
+            self.search_index.save()
+            self.rollup.save()
+            if self.outbox is not None:
+                self.outbox.close()
+            self.workers.shutdown()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save data: {str(e)}")
+        self.root.destroy()
+
+    def load_settings(self):
+        try:
+            if os.path.exists(SETTINGS_FILE):
+                with open(SETTINGS_FILE, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load settings: {str(e)}")
+        return {}
 
     def create_header(self):
         # Main header container with gradient effect
@@ -112,7 +3268,7 @@ class LifeManagerApp:
         # Date display
         self.date_label = ttb.Label(
             info_frame,
-            text=datetime.now().strftime("%A, %d %B %Y"),
+            text=self.clock.date.strftime("%A, %d %B %Y"),
             font=("Helvetica", 10),
             bootstyle="primary inverse"
         )
@@ -134,19 +3290,24 @@ class LifeManagerApp:
         
         # Update time immediately (moved after creating greeting_label)
         self.update_time()
+        self.check_greeting_hour()
+        
+        # Nobody sees the clock while the window is minimized
+        self.timers.every(1000, self.update_time, hidden=TimerWheel.PAUSE)
+        self.timers.every(60 * 1000, self.check_greeting_hour,
+                          unfocused=5 * 60 * 1000, hidden=TimerWheel.PAUSE)
 
     def update_time(self):
-        """Update the time display every second"""
+        """Update the time display; the timer wheel calls this every second"""
         current_time = datetime.now().strftime("%I:%M:%S %p")
         self.time_label.config(text=current_time)
-        
+
+    def check_greeting_hour(self):
         # Update greeting if hour changes
         hour_now = datetime.now().hour
         if hour_now != getattr(self, 'last_hour', None):
             self.last_hour = hour_now
             self.update_greeting()
-            
-        self.root.after(1000, self.update_time)
 
     def update_greeting(self):
         """Update the greeting based on time of day"""
@@ -201,20 +3362,95 @@ class LifeManagerApp:
         btn.pack(fill=X, padx=10, pady=3)
         return btn
 
-    def clear_content(self):
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+    def raise_page(self, name):
+        """Swap the cached page for name into view
+
+        Returns False when there is no live copy of the page; page_content and
+        page_sidebar are then fresh frames for the caller to build into.
+        """
+        current = self.pages.get(self.active_page)
+        if current is not None:
+            for frame in current:
+                frame.pack_forget()
+        self.active_page = name
+        
+        page = self.pages.get(name)
+        if page is not None and name not in self.stale_pages:
+            self.page_content, self.page_sidebar = page
+            for frame in page:
+                frame.pack(fill=BOTH, expand=YES)
+            return True
+        
+        # First visit, or a change the page had no way to patch
+        if page is not None:
+            for frame in page:
+                frame.destroy()
+        self.stale_pages.discard(name)
+        self.repaints.forget(name)
+        self.page_watchers[name] = []
+        page = (ttb.Frame(self.content_frame, bootstyle="light"),
+                ttb.Frame(self.sidebar_content, bootstyle="light"))
+        self.pages[name] = page
+        self.page_content, self.page_sidebar = page
+        for frame in page:
+            frame.pack(fill=BOTH, expand=YES)
+        return False
+
+    def watch(self, kinds, repaint, note=None):
+        """Repaint part of the page being built, once per idle pass, after kinds change
+
+        note(event, kind, record, old) runs on every change, for repaints that
+        need to know which records to patch.
+        """
+        self.page_watchers[self.active_page].append((kinds, repaint, note))
 
-    def clear_sidebar_content(self):
-        for widget in self.sidebar_content.winfo_children():
-            widget.destroy()
+    def rebuild_active_page(self):
+        # A stale page on screen can't wait for the next visit
+        if self.active_page in self.stale_pages:
+            getattr(self, f"show_{self.active_page}")()
+
+    def live_section(self, parent, kinds, build):
+        """Fill parent with build(parent), redoing just that when kinds change"""
+        def refresh():
+            for widget in parent.winfo_children():
+                widget.destroy()
+            build(parent)
+        
+        build(parent)
+        self.watch(kinds, refresh)
+
+    def on_store_change(self, event, kind, record, old):
+        """Mark the regions a change touches; they repaint together when idle"""
+        if event in ('load', 'clear', 'day'):
+            self.stale_pages.update(self.pages)
+        else:
+            for name, watchers in self.page_watchers.items():
+                if name in self.stale_pages:
+                    continue
+                for kinds, repaint, note in watchers:
+                    if kind in kinds:
+                        if note is not None:
+                            note(event, kind, record, old)
+                        self.repaints.invalidate(repaint, name)
+        
+        if self.active_page in self.stale_pages:
+            self.repaints.invalidate(self.rebuild_active_page)
+
+    def on_new_day(self, clock):
+        """Midnight: move the counts along and redo what shows the date"""
+        self.stats.roll_to(clock.today)
+        self.date_label.configure(text=clock.date.strftime("%A, %d %B %Y"))
+        self.send_overdue_digest()
+        # Greetings, the Today tab and the due-today counts all change, so
+        # every page is rebuilt once, as after a reload
+        self.on_store_change('day', None, None, None)
 
     def show_dashboard(self):
-        self.clear_content()
-        self.active_page = "dashboard"
+        if self.raise_page("dashboard"):
+            return
         
         # Create dashboard layout with premium styling
-        dashboard = ScrolledFrame(self.content_frame, bootstyle="rounded")
+        dashboard = ScrolledFrame(self.page_content, bootstyle="rounded")
         dashboard.pack(fill=BOTH, expand=YES)
         
         # Add greeting header with time-based message
@@ -228,32 +3464,30 @@ class LifeManagerApp:
         stats_row = ttb.Frame(stats_frame)
         stats_row.pack(fill=X)
         
-        # Calculate statistics with more detailed information
-        tasks_due_today = [t for t in self.tasks if self.is_due_today(t)]
-        goals_in_progress = [g for g in self.goals if not g.get('completed', False)]
-        completed_tasks = [t for t in self.tasks if t.get('completed', False)]
-        achieved_goals = [g for g in self.goals if g.get('completed', False)]
+        # Statistics are read from the live counters, so the cards can be
+        # refreshed in place when tasks or goals change
+        stats = self.stats
         
         # Stats cards with different colors, icons, and hover effects
         self.create_enhanced_stat_card(stats_row, "Tasks Due Today", 
-                                len(tasks_due_today), 
+                                stats.due_today, 
                                 "info", "calendar-day", 
-                                f"{len(tasks_due_today)} of {len(self.tasks)} total tasks")
+                                lambda: f"{stats.due_today()} of {stats.tasks_total} total tasks")
         
         self.create_enhanced_stat_card(stats_row, "Goals in Progress", 
-                                len(goals_in_progress), 
+                                stats.goals_active, 
                                 "success", "bullseye", 
-                                f"{len(goals_in_progress)} active goals")
+                                lambda: f"{stats.goals_active()} active goals")
         
         self.create_enhanced_stat_card(stats_row, "Completed Tasks", 
-                                len(completed_tasks), 
+                                lambda: stats.tasks_completed, 
                                 "primary", "check-circle", 
-                                f"{(len(completed_tasks)/max(1, len(self.tasks))*100):.1f}% completion rate")
+                                lambda: f"{(stats.tasks_completed/max(1, stats.tasks_total)*100):.1f}% completion rate")
         
         self.create_enhanced_stat_card(stats_row, "Achieved Goals", 
-                                len(achieved_goals), 
+                                lambda: stats.goals_completed, 
                                 "warning", "trophy", 
-                                f"{len(achieved_goals)} of {len(self.goals)} total goals")
+                                lambda: f"{stats.goals_completed} of {stats.goals_total} total goals")
         
         # Create second row for progress summary and charts
         dashboard_grid = ttb.Frame(dashboard)
@@ -264,7 +3498,10 @@ class LifeManagerApp:
         left_column.pack(fill=BOTH, expand=YES)
         
         # Today's Schedule with modern card style and improved UI
-        self.create_todays_schedule(left_column, tasks_due_today)
+        self.create_todays_schedule(left_column)
+        
+        # Completions over the last week or month, from the daily rollup
+        self.create_productivity_chart(left_column)
         
         # Update sidebar content
         self.update_sidebar_content()
@@ -294,7 +3531,7 @@ class LifeManagerApp:
         ).pack(side=LEFT, pady=10, padx=10)
         
         # Add date display
-        current_date = datetime.now().strftime("%A, %d %B %Y")
+        current_date = self.clock.date.strftime("%A, %d %B %Y")
         ttb.Label(
             greeting_frame,
             text=current_date,
@@ -303,6 +3540,7 @@ class LifeManagerApp:
         ).pack(side=RIGHT, pady=10, padx=10)
 
     def create_enhanced_stat_card(self, parent, title, value, color, icon_name, subtitle):
+        """Stat card whose value and subtitle callables are re-read on each change"""
         # Create card frame with better styling and hover effect
         card_frame = ttb.Frame(parent, bootstyle=f"{color}")
         card_frame.pack(side=LEFT, fill=BOTH, expand=YES, padx=5, pady=5)
@@ -347,12 +3585,13 @@ class LifeManagerApp:
             ).pack(side=RIGHT, padx=(10, 0))
         
         # Card value with large font
-        ttb.Label(
+        value_label = ttb.Label(
             content_frame,
-            text=str(value),
+            text=str(value()),
             font=("Helvetica", 24, "bold"),
             bootstyle=f"inverse-{color}"
-        ).pack(anchor="w")
+        )
+        value_label.pack(anchor="w")
         
         # Card title
         ttb.Label(
@@ -363,31 +3602,49 @@ class LifeManagerApp:
         ).pack(anchor="w")
         
         # Add subtitle with additional context
-        ttb.Label(
+        subtitle_label = ttb.Label(
             content_frame,
-            text=subtitle,
+            text=subtitle(),
             font=("Helvetica", 8),
             bootstyle=f"inverse-{color}"
-        ).pack(anchor="w", pady=(5, 0))
+        )
+        subtitle_label.pack(anchor="w", pady=(5, 0))
+        
+        def refresh():
+            value_label.configure(text=str(value()))
+            subtitle_label.configure(text=subtitle())
+        
+        self.watch(('tasks', 'goals'), refresh)
 
     def show_tasks(self):
-        self.clear_content()
-        self.active_page = "tasks"
+        if self.raise_page("tasks"):
+            return
         
         # Create header with title and add button
-        header_frame = ttb.Frame(self.content_frame, bootstyle="light")
+        header_frame = ttb.Frame(self.page_content, bootstyle="light")
         header_frame.pack(fill=X, padx=0, pady=0)
         
         # Add a gradient effect to header
         header_canvas = tk.Canvas(header_frame, height=80, highlightthickness=0)
         header_canvas.pack(fill=X)
         
-        # Create gradient header
-        header_canvas.create_rectangle(0, 0, 5000, 80, fill="#3498db", outline="")
-        for i in range(80):
-            # Create gradient from blue to slightly lighter blue
-            color = f'#{37+i//8:02x}{153+i//8:02x}{220+i//8:02x}'
-            header_canvas.create_line(0, i, 5000, i, fill=color)
+        # The gradient is one cached image, redone only for a new theme or size
+        header_background = header_canvas.create_image(0, 0, anchor="nw")
+        
+        def paint_header(event=None):
+            # Before the first layout the canvas is 1 px wide; wait for <Configure>
+            if header_canvas.winfo_width() <= 1:
+                return
+            top = self.style.colors.primary
+            image = self.decorations.image(
+                'tasks_header', self.style.theme.name, top, lighten(top, 10),
+                header_canvas.winfo_width(), 80
+            )
+            header_canvas.itemconfigure(header_background, image=image)
+        
+        paint_header()
+        header_canvas.bind("<Configure>", paint_header, add="+")
+        header_canvas.bind("<<ThemeChanged>>", paint_header, add="+")
         
         # Add title on the header
         header_canvas.create_text(30, 40, text="Task Manager", font=("Helvetica", 18, "bold"), fill="white", anchor="w")
@@ -401,6 +3658,17 @@ class LifeManagerApp:
                                bootstyle="light", font=("Helvetica", 11))
         search_entry.pack(side=LEFT, padx=5)
         
+        # Priority filter, applied by the store along with the tab's filters
+        priority_var = tk.StringVar(value="All Priorities")
+        priority_menu = ttb.Combobox(
+            search_frame,
+            textvariable=priority_var,
+            values=["All Priorities", "High", "Medium", "Low"],
+            state="readonly",
+            width=14
+        )
+        priority_menu.pack(side=LEFT, padx=5)
+        
         # Add New Task button with icon
         add_btn = ttb.Button(
             header_canvas, 
@@ -412,11 +3680,12 @@ class LifeManagerApp:
         header_canvas.create_window(30, 120, window=add_btn, anchor="w")
         
         # Main content area with scrolling
-        main_content = ttb.Frame(self.content_frame)
+        main_content = ttb.Frame(self.page_content)
         main_content.pack(fill=BOTH, expand=YES, padx=15, pady=(70, 15))
         
-        # Create tabs for different task views
-        task_tabs = ttb.Notebook(main_content)
+        # Create tabs for different task views; the sidebar's Quick Filters
+        # switch between them too
+        task_tabs = self.task_tabs = ttb.Notebook(main_content)
         task_tabs.pack(fill=BOTH, expand=YES)
         
         # All tasks tab
@@ -435,100 +3704,87 @@ class LifeManagerApp:
         completed_tab = ttb.Frame(task_tabs, padding=10)
         task_tabs.add(completed_tab, text="Completed")
         
-        # Create scrollable containers for each tab
-        all_container = ScrolledFrame(all_tasks_tab)
+        # Create virtualized task lists for each tab
+        all_container = VirtualTaskList(all_tasks_tab, self)
         all_container.pack(fill=BOTH, expand=YES)
         
-        today_container = ScrolledFrame(today_tab)
+        today_container = VirtualTaskList(today_tab, self)
         today_container.pack(fill=BOTH, expand=YES)
         
-        upcoming_container = ScrolledFrame(upcoming_tab)
+        upcoming_container = VirtualTaskList(upcoming_tab, self)
         upcoming_container.pack(fill=BOTH, expand=YES)
         
-        completed_container = ScrolledFrame(completed_tab)
+        completed_container = VirtualTaskList(completed_tab, self)
         completed_container.pack(fill=BOTH, expand=YES)
         
-        # Set active task container
-        task_container = all_container
-        self.filtered_tasks = self.tasks
-        
-        def search_tasks(*args):
-            search_term = search_var.get().lower().strip()
+        def search_tasks(search_term):
             current_tab = task_tabs.select()
             tab_index = task_tabs.index(current_tab)
             
             # Get the appropriate container based on current tab
             if tab_index == 0:  # All Tasks
                 container = all_container
-                tasks = self.tasks
+                filters = {}
             elif tab_index == 1:  # Today
                 container = today_container
-                today_date = datetime.now().strftime('%Y-%m-%d')
-                tasks = [t for t in self.tasks if t.get('date') == today_date]
+                filters = {'date': self.clock.iso}
             elif tab_index == 2:  # Upcoming
                 container = upcoming_container
-                today_date = datetime.now().strftime('%Y-%m-%d')
-                tasks = [t for t in self.tasks if t.get('date') > today_date]
+                filters = {'after': self.clock.iso}
             else:  # Completed
                 container = completed_container
-                tasks = [t for t in self.tasks if t.get('completed', False)]
+                filters = {'completed': True}
+            if priority_var.get() != "All Priorities":
+                filters['priority'] = priority_var.get()
             
-            # Filter tasks based on search term
+            # A task change re-runs the same query, which keeps the list's scroll
+            query = (search_term, tuple(sorted(filters.items())))
+            
+            # Filter tasks based on search term, looking up only the matches
             if search_term:
-                self.filtered_tasks = [
-                    t for t in tasks 
-                    if search_term in t.get('title', '').lower() or 
-                       search_term in t.get('description', '').lower()
-                ]
-            else:
-                self.filtered_tasks = tasks
+                filters['ids'] = self.search_index.search('tasks', search_term)
+            return container, self.store.find_tasks(**filters), query
+        
+        def show_results(results, first):
+            container, self.filtered_tasks, query = results
             
-            # Render the filtered tasks
-            self.render_task_list(container)
+            # Render the filtered tasks; the list only draws rows in view
+            self.render_task_list(container, query)
+        
+        search = SearchPipeline(
+            self.root,
+            lambda: search_var.get().lower().strip(),
+            search_tasks,
+            show_results,
+            delay=self.settings.get('search_debounce_ms', 150)
+        )
         
         # Bind search function to search box
-        search_var.trace_add('write', search_tasks)
+        search_var.trace_add('write', search.request)
         
         # Add search button
         search_btn = ttb.Button(
             search_frame,
             text="🔍",
-            command=search_tasks,
+            command=search.run_now,
             bootstyle="light-outline",
             width=3
         )
         search_btn.pack(side=LEFT)
         
-        # Handle tab changes
-        def tab_changed(event):
-            nonlocal task_container
-            tab_index = task_tabs.index(task_tabs.select())
-            
-            if tab_index == 0:  # All Tasks
-                task_container = all_container
-                self.filtered_tasks = self.tasks
-            elif tab_index == 1:  # Today
-                task_container = today_container
-                today_date = datetime.now().strftime('%Y-%m-%d')
-                self.filtered_tasks = [t for t in self.tasks if t.get('date') == today_date]
-            elif tab_index == 2:  # Upcoming
-                task_container = upcoming_container
-                today_date = datetime.now().strftime('%Y-%m-%d')
-                self.filtered_tasks = [t for t in self.tasks if t.get('date') > today_date]
-            elif tab_index == 3:  # Completed
-                task_container = completed_container
-                self.filtered_tasks = [t for t in self.tasks if t.get('completed', False)]
-            
-            # Re-apply search filter if there's a search term
-            search_tasks()
-        
-        task_tabs.bind("<<NotebookTabChanged>>", tab_changed)
+        # Handle tab and priority changes, keeping any search term
+        task_tabs.bind("<<NotebookTabChanged>>", search.run_now)
+        priority_menu.bind("<<ComboboxSelected>>", search.run_now)
         
         # Initial render
-        self.render_task_list(task_container)
+        search.run_now()
+        
+        # Re-run the current tab's query when tasks change; only the rows in
+        # view are rebound
+        self.watch(('tasks',), search.run_now)
         
         # Right sidebar panel
-        right_panel = ttb.Frame(self.content_frame, width=300)
+        right_panel = ttb.Frame(self.page_content, width=300)
         right_panel.pack(fill=Y, expand=NO, side=RIGHT)
         right_panel.pack_propagate(False)
         
@@ -547,35 +3803,17 @@ class LifeManagerApp:
         # Recent Activity
         activity_frame = ttb.Labelframe(right_panel, text="Recent Activity", padding=10)
         activity_frame.pack(fill=X, padx=5, pady=5)
+        self.live_section(activity_frame, ('tasks', 'goals'), self.create_activity_rows)
         
-        # Example activities
-        activities = [
-            ("Added new task", "5 mins ago"),
-            ("Completed goal", "1 hour ago"),
-            ("Updated task", "2 hours ago")
-        ]
-        
-        for activity, time in activities:
-            activity_item = ttb.Frame(activity_frame)
-            activity_item.pack(fill=X, pady=2)
-            
-            ttb.Label(
-                activity_item,
-                text=activity,
-                font=("Helvetica", 10),
-                bootstyle="primary"
-            ).pack(side=LEFT)
-            
-            ttb.Label(
-                activity_item,
-                text=time,
-                font=("Helvetica", 8),
-                bootstyle="secondary"
-            ).pack(side=RIGHT)
+        # Update sidebar
+        self.update_sidebar_content()
 
-    def add_task_dialog(self):
+    def add_task_dialog(self, task_id=None):
+        # Editing reuses this dialog with the existing task's values
+        task = self.store.get('tasks', task_id) if task_id else None
+        
         dialog = ttb.Toplevel(self.root)
-        dialog.title("Add New Task")
+        dialog.title("Edit Task" if task else "Add New Task")
         dialog.geometry("400x500")
         
         form_frame = ttb.Frame(dialog, padding=20)
@@ -651,6 +3889,16 @@ class LifeManagerApp:
         description_text = tk.Text(form_frame, height=4)
         description_text.pack(fill=X, pady=(0, 10))
         
+        if task:
+            title_var.set(task.title or '')
+            date_entry.entry.delete(0, tk.END)
+            date_entry.entry.insert(0, task.date or '')
+            if task.time_min is not None:
+                hours.set(f"{task.time_min // 60:02d}")
+                minutes.set(f"{task.time_min % 60:02d}")
+            priority_var.set(task.priority or "Medium")
+            description_text.insert("1.0", task.description or '')
+        
         def save_task():
             try:
                 # Validate inputs
@@ -678,17 +3926,19 @@ class LifeManagerApp:
                 except ValueError:
                     raise ValueError("Invalid date format")
                 
-                task = {
+                fields = {
                     'title': title_var.get().strip(),
                     'date': selected_date,
                     'time': task_time,
                     'priority': priority_var.get(),
-                    'description': description_text.get("1.0", tk.END).strip(),
-                    'completed': False
+                    'description': description_text.get("1.0", tk.END).strip()
                 }
                 
-                self.tasks.append(task)
-                self.save_data()
+                if task:
+                    self.persist('update', 'tasks', task.id, **fields)
+                else:
+                    fields['created_date'] = self.clock.iso
+                    self.persist('add', 'tasks', Task(completed=False, **fields))
                 dialog.destroy()
                 self.show_tasks()
             except ValueError as e:
@@ -704,11 +3954,11 @@ class LifeManagerApp:
         ).pack(pady=20)
 
     def show_goals(self):
-        self.clear_content()
-        self.active_page = "goals"
+        if self.raise_page("goals"):
+            return
         
         # Create goals layout
-        goals_frame = ScrolledFrame(self.content_frame)
+        goals_frame = ScrolledFrame(self.page_content)
         goals_frame.pack(fill=BOTH, expand=YES)
         
         # Add goal button
@@ -727,72 +3977,44 @@ class LifeManagerApp:
         goals_list = ttb.Labelframe(goals_frame, text="Your Goals", padding=10)
         goals_list.pack(fill=X, padx=20, pady=10)
         
-        if not self.goals:
-            ttb.Label(
-                goals_list,
-                text="No goals added yet",
-                bootstyle="secondary"
-            ).pack(pady=10)
-        else:
-            for goal in self.goals:
-                self.create_goal_item(goals_list, goal)
-        
-        # Right sidebar panel
-        right_panel = ttb.Frame(self.content_frame, width=300)
-        right_panel.pack(fill=Y, expand=NO, side=RIGHT)
-        right_panel.pack_propagate(False)
-        
-        # Goal Statistics
-        stats_frame = ttb.Labelframe(right_panel, text="Goal Statistics", padding=10)
-        stats_frame.pack(fill=X, padx=5, pady=5)
-        
-        stats = [
-            ("Total Goals", len(self.goals)),
-            ("In Progress", len([g for g in self.goals if not g.get('completed', False)])),
-            ("Achieved", len([g for g in self.goals if g.get('completed', False)]))
-        ]
-        
-        for label, value in stats:
-            stat_item = ttb.Frame(stats_frame)
-            stat_item.pack(fill=X, pady=2)
-            
-            ttb.Label(
-                stat_item,
-                text=label,
-                font=("Helvetica", 10),
-                bootstyle="secondary"
-            ).pack(side=LEFT)
+        empty_label = ttb.Label(
+            goals_list,
+            text="No goals added yet",
+            bootstyle="secondary"
+        )
+        goal_items = {}
+        for goal in self.goals:
+            goal_items[goal.id] = self.create_goal_item(goals_list, goal)
+        if not goal_items:
+            empty_label.pack(pady=10)
+        
+        # Swap in fresh cards for just the goals that changed
+        changed_goals = {}
+        
+        def goal_changed(event, kind, record, old):
+            changed_goals[record.id] = None
+        
+        def patch_goals():
+            for goal_id in changed_goals:
+                item = goal_items.pop(goal_id, None)
+                goal = self.store.goal_map.get(goal_id)
+                if goal is not None:
+                    goal_items[goal_id] = self.create_goal_item(goals_list, goal)
+                    if item is not None:
+                        goal_items[goal_id].pack_configure(before=item)
+                if item is not None:
+                    item.destroy()
+            changed_goals.clear()
             
-            ttb.Label(
-                stat_item,
-                text=str(value),
-                font=("Helvetica", 10, "bold"),
-                bootstyle="primary"
-            ).pack(side=RIGHT)
-        
-        # Categories
-        categories_frame = ttb.Labelframe(right_panel, text="Categories", padding=10)
-        categories_frame.pack(fill=X, padx=5, pady=5)
+            if goal_items:
+                empty_label.pack_forget()
+            else:
+                empty_label.pack(pady=10)
         
-        categories = self.get_goal_categories()
+        self.watch(('goals',), patch_goals, goal_changed)
         
-        for category, count in categories.items():
-            category_item = ttb.Frame(categories_frame)
-            category_item.pack(fill=X, pady=2)
-            
-            ttb.Label(
-                category_item,
-                text=category,
-                font=("Helvetica", 10),
-                bootstyle="secondary"
-            ).pack(side=LEFT)
-            
-            ttb.Label(
-                category_item,
-                text=str(count),
-                font=("Helvetica", 10, "bold"),
-                bootstyle="primary"
-            ).pack(side=RIGHT)
+        # Update sidebar
+        self.update_sidebar_content()
 
     def add_goal_dialog(self):
         dialog = ttb.Toplevel(self.root)
@@ -813,7 +4035,7 @@ class LifeManagerApp:
         date_entry.pack(fill=X, pady=(0, 10))
         
         # Set default date to 30 days from now
-        future_date = datetime.now() + timedelta(days=30)
+        future_date = self.clock.date + timedelta(days=30)
         date_entry.entry.delete(0, tk.END)
         date_entry.entry.insert(0, future_date.strftime("%Y-%m-%d"))
         
@@ -839,17 +4061,16 @@ class LifeManagerApp:
         
         def save_goal():
             try:
-                goal = {
-                    'title': title_var.get(),
-                    'target_date': date_entry.entry.get(),
-                    'category': category_var.get(),
-                    'description': description_text.get("1.0", tk.END).strip(),
-                    'milestones': [m for m in milestones_text.get("1.0", tk.END).strip().split('\n') if m],
-                    'completed': False
-                }
+                goal = Goal(
+                    title=title_var.get(),
+                    target_date=date_entry.entry.get(),
+                    category=category_var.get(),
+                    description=description_text.get("1.0", tk.END).strip(),
+                    milestones=[m for m in milestones_text.get("1.0", tk.END).strip().split('\n') if m],
+                    completed=False
+                )
                 
-                self.goals.append(goal)
-                self.save_data()
+                self.persist('add', 'goals', goal)
                 dialog.destroy()
                 self.show_goals()
             except Exception as e:
@@ -863,17 +4084,18 @@ class LifeManagerApp:
         ).pack(pady=20)
 
     def show_calendar(self):
-        self.clear_content()
+        if self.raise_page("calendar"):
+            return
         
         # Create calendar layout
-        calendar_frame = ttb.Frame(self.content_frame)
+        calendar_frame = ttb.Frame(self.page_content)
         calendar_frame.pack(fill=BOTH, expand=YES)
         
         # Calendar header
         header_frame = ttb.Frame(calendar_frame)
         header_frame.pack(fill=X, padx=20, pady=10)
         
-        current_date = datetime.now()
+        current_date = self.clock.date
         month_year = current_date.strftime("%B %Y")
         
         ttb.Label(
@@ -882,139 +4104,18 @@ class LifeManagerApp:
             font=("Helvetica", 16, "bold")
         ).pack(side=LEFT)
         
-        # Calendar grid
-        grid_frame = ttb.Frame(calendar_frame)
-        grid_frame.pack(fill=BOTH, expand=YES, padx=20, pady=10)
-        
-        # Days of week header
-        days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-        for i, day in enumerate(days):
-            ttb.Label(
-                grid_frame,
-                text=day,
-                font=("Helvetica", 10, "bold")
-            ).grid(row=0, column=i, pady=5)
-
-    def create_task_item(self, parent, task):
-        # Determine task priority and set appropriate styling
-        priority = task.get('priority', 'Medium')
-        completed = task.get('completed', False)
-        
-        # Set color based on priority and completion status
-        if completed:
-            border_color = "#888888"
-            background_color = "#f0f0f0"
-        elif priority == "High":
-            border_color = "#e74c3c"
-            background_color = "#fdedec"
-        elif priority == "Medium":
-            border_color = "#f39c12"
-            background_color = "#fef5e7"
-        else:  # Low
-            border_color = "#3498db"
-            background_color = "#ebf5fb"
-        
-        # Create task frame with custom styling
-        task_frame = ttb.Frame(parent, height=90, relief="solid", borderwidth=1)
-        task_frame.pack(fill=X, padx=10, pady=5)
-        task_frame.pack_propagate(False)  # Maintain fixed height
-        
-        # Add a canvas for the left border color indicator
-        indicator = tk.Canvas(task_frame, width=4, highlightthickness=0)
-        indicator.pack(side=LEFT, fill=Y)
-        indicator.create_rectangle(0, 0, 10, 500, fill=border_color, outline="")
-        
-        # Create content frame
-        content = ttb.Frame(task_frame, padding=10)
-        content.pack(side=LEFT, fill=BOTH, expand=YES)
-        
-        # Title with strikethrough if completed
-        title_text = task.get('title', 'Untitled Task')
-        if completed:
-            title_text = "✓ " + title_text
-        
-        title = ttb.Label(
-            content,
-            text=title_text,
-            font=("Helvetica", 12, "bold"),
-            anchor="w",
-            bootstyle="secondary" if completed else "default"
-        )
-        title.pack(anchor=W, pady=(0, 5))
-        
-        # Description (if available)
-        description = task.get('description', '').strip()
-        if description:
-            desc_label = ttb.Label(
-                content,
-                text=description[:75] + ('...' if len(description) > 75 else ''),
-                bootstyle="secondary",
-                anchor="w"
-            )
-            desc_label.pack(anchor=W, fill=X)
-        
-        # Time and additional info at bottom
-        info_frame = ttb.Frame(content)
-        info_frame.pack(fill=X, pady=(5, 0), anchor=W)
-        
-        # Format time nicely
-        time_str = task.get('time', '')
-        if time_str:
-            try:
-                time_obj = datetime.strptime(time_str, '%H:%M')
-                time_str = time_obj.strftime('%I:%M %p')
-            except ValueError:
-                pass
-        
-        # Add time label
-        time_label = ttb.Label(
-            info_frame,
-            text=time_str,
-            bootstyle="secondary",
-            font=("Helvetica", 10)
-        )
-        time_label.pack(side=LEFT)
-        
-        # Add priority indicator
-        if not completed:
-            priority_text = f"• {priority} Priority"
-            priority_label = ttb.Label(
-                info_frame,
-                text=priority_text,
-                bootstyle="secondary",
-                font=("Helvetica", 10)
-            )
-            priority_label.pack(side=LEFT, padx=(10, 0))
-        
-        # Button frame on the right
-        btn_frame = ttb.Frame(task_frame)
-        btn_frame.pack(side=RIGHT, padx=10, fill=Y)
-        
-        # Add action buttons
-        if not completed:
-            complete_btn = ttb.Button(
-                btn_frame,
-                text="Complete",
-                bootstyle="success-outline",
-                command=lambda: self.complete_task(task),
-                width=9
-            )
-            complete_btn.pack(side=TOP, pady=5)
-        
-        delete_btn = ttb.Button(
-            btn_frame,
-            text="Delete",
-            bootstyle="danger-outline",
-            command=lambda: self.delete_task(task),
-            width=9
-        )
-        delete_btn.pack(side=TOP, pady=5)
+        # Calendar grid
+        grid_frame = ttb.Frame(calendar_frame)
+        grid_frame.pack(fill=BOTH, expand=YES, padx=20, pady=10)
         
-        # Make entire task clickable for details
-        for widget in [task_frame, content, title, info_frame]:
-            widget.bind("<Button-1>", lambda e, t=task: self.show_task_details(t))
-            widget.bind("<Enter>", lambda e, tf=task_frame: self.on_task_hover(tf, True))
-            widget.bind("<Leave>", lambda e, tf=task_frame: self.on_task_hover(tf, False))
+        # Days of week header
+        days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+        for i, day in enumerate(days):
+            ttb.Label(
+                grid_frame,
+                text=day,
+                font=("Helvetica", 10, "bold")
+            ).grid(row=0, column=i, pady=5)
 
     def create_goal_item(self, parent, goal):
         goal_frame = ttb.Frame(parent, bootstyle="light")
@@ -1034,33 +4135,33 @@ class LifeManagerApp:
         
         ttb.Label(
             header_frame,
-            text=goal['title'],
+            text=goal.title,
             font=("Helvetica", 12, "bold")
         ).pack(side=LEFT)
         
         ttb.Label(
             header_frame,
-            text=goal['category'],
+            text=goal.category,
             bootstyle="info"
         ).pack(side=LEFT, padx=5)
         
         ttb.Label(
             header_frame,
-            text=f"Due: {goal['target_date']}",
+            text=f"Due: {goal.target_date}",
             bootstyle="secondary"
         ).pack(side=RIGHT)
         
-        if goal.get('description'):
+        if goal.description:
             ttb.Label(
                 content_frame,
-                text=goal['description'],
+                text=goal.description,
                 font=("Helvetica", 10),
                 bootstyle="secondary",
                 wraplength=600
             ).pack(anchor=W, pady=(5, 0))
         
         # Milestones
-        if goal.get('milestones'):
+        if goal.milestones:
             milestone_frame = ttb.Frame(content_frame)
             milestone_frame.pack(fill=X, pady=(5, 0))
             
@@ -1071,7 +4172,7 @@ class LifeManagerApp:
                 bootstyle="secondary"
             ).pack(anchor=W)
             
-            for milestone in goal['milestones']:
+            for milestone in goal.milestones:
                 ttb.Label(
                     milestone_frame,
                     text=f"• {milestone}",
@@ -1088,12 +4189,12 @@ class LifeManagerApp:
         ttb.Button(
             button_frame,
             text="Delete",
-            command=lambda g=goal: self.delete_goal(g),
+            command=lambda goal_id=goal.id: self.delete_goal(goal_id),
             bootstyle="danger-outline",
             width=8
         ).pack(side=RIGHT, padx=5)
         
-        if goal.get('completed', False):
+        if goal.completed:
             ttb.Label(
                 button_frame,
                 text="✓ Achieved",
@@ -1104,69 +4205,63 @@ class LifeManagerApp:
             ttb.Button(
                 button_frame,
                 text="Mark Achieved",
-                command=lambda g=goal: self.complete_goal(g),
+                command=lambda goal_id=goal.id: self.complete_goal(goal_id),
                 bootstyle="success-outline",
                 width=12
             ).pack(side=RIGHT, padx=5)
+        
+        return goal_frame
 
-    def delete_task(self, task):
+    def delete_task(self, task_id):
         if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this task?"):
             try:
-                self.tasks.remove(task)
-                self.save_data()
-                self.show_tasks()
+                self.store.remove('tasks', task_id)
                 messagebox.showinfo("Success", "Task deleted successfully!")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to delete task: {str(e)}")
 
-    def delete_goal(self, goal):
+    def delete_goal(self, goal_id):
         if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this goal?"):
             try:
-                self.goals.remove(goal)
-                self.save_data()
-                self.show_goals()
+                self.store.remove('goals', goal_id)
                 messagebox.showinfo("Success", "Goal deleted successfully!")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to delete goal: {str(e)}")
 
-    def complete_task(self, task):
-        task['completed'] = True
-        self.save_data()
-        self.show_tasks()
+    def complete_task(self, task_id):
+        self.persist('update', 'tasks', task_id, completed=True,
+                     completion_date=self.clock.iso)
 
-    def complete_goal(self, goal):
-        goal['completed'] = True
-        self.save_data()
-        self.show_goals()
+    def complete_goal(self, goal_id):
+        self.persist('update', 'goals', goal_id, completed=True)
 
-    def is_due_today(self, task):
-        return task['date'] == datetime.now().strftime("%Y-%m-%d")
+    def edit_task(self, task_id):
+        self.add_task_dialog(task_id)
 
     def load_data(self):
         try:
-            if os.path.exists('life_manager_data.json'):
-                with open('life_manager_data.json', 'r') as f:
-                    data = json.load(f)
-                    self.tasks = data.get('tasks', [])
-                    self.goals = data.get('goals', [])
+            self.store.load()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load data: {str(e)}")
 
-    def save_data(self):
+    def on_save_error(self, error):
+        messagebox.showerror("Error", f"Failed to save data: {str(error)}")
+
+    def persist(self, action, kind, *args, **fields):
+        """Apply one add, update or remove through the store"""
         try:
-            with open('life_manager_data.json', 'w') as f:
-                json.dump({
-                    'tasks': self.tasks,
-                    'goals': self.goals
-                }, f)
+            if action == 'add':
+                return self.store.add(kind, *args)
+            elif action == 'update':
+                return self.store.update(kind, *args, **fields)
+            elif action == 'remove':
+                return self.store.remove(kind, *args)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save data: {str(e)}")
 
    
 
     def update_sidebar_content(self):
-        self.clear_sidebar_content()
-        
         # Show different content based on active page
         if self.active_page == "dashboard":
             self.show_dashboard_sidebar()
@@ -1181,7 +4276,7 @@ class LifeManagerApp:
 
     def show_dashboard_sidebar(self):
         # Quick Actions
-        actions_frame = ttb.Labelframe(self.sidebar_content, text="Quick Actions", padding=10)
+        actions_frame = ttb.Labelframe(self.page_sidebar, text="Quick Actions", padding=10)
         actions_frame.pack(fill=X, padx=5, pady=5)
         
         ttb.Button(
@@ -1201,51 +4296,60 @@ class LifeManagerApp:
         ).pack(pady=2)
         
         # Recent Activity
-        activity_frame = ttb.Labelframe(self.sidebar_content, text="Recent Activity", padding=10)
+        activity_frame = ttb.Labelframe(self.page_sidebar, text="Recent Activity", padding=10)
         activity_frame.pack(fill=X, padx=5, pady=5)
+        self.live_section(activity_frame, ('tasks', 'goals'), self.create_activity_rows)
+
+        # Add Goal Progress section below Recent Activity
+        goals_frame = ttb.Labelframe(self.page_sidebar, text="Goal Progress", padding=10)
+        goals_frame.pack(fill=X, padx=5, pady=5)
+        self.live_section(goals_frame, ('goals',), self.create_goal_progress_rows)
+
+    def create_activity_rows(self, parent):
+        entries = self.activity.latest(3)
+        if not entries:
+            ttb.Label(
+                parent,
+                text="No activity yet",
+                font=("Helvetica", 10),
+                bootstyle="secondary"
+            ).pack(anchor=W)
+            return
         
-        # Example activities
-        activities = [
-            ("Added new task", "5 mins ago"),
-            ("Completed goal", "1 hour ago"),
-            ("Updated task", "2 hours ago")
-        ]
-        
-        for activity, time in activities:
-            activity_item = ttb.Frame(activity_frame)
+        now = time.time()
+        for entry in entries:
+            activity_item = ttb.Frame(parent)
             activity_item.pack(fill=X, pady=2)
             
+            text = self.activity.describe(entry)
             ttb.Label(
                 activity_item,
-                text=activity,
+                text=text if len(text) <= 28 else text[:25] + "...",
                 font=("Helvetica", 10),
                 bootstyle="primary"
             ).pack(side=LEFT)
             
             ttb.Label(
                 activity_item,
-                text=time,
+                text=format_ago(now - entry[0]),
                 font=("Helvetica", 8),
                 bootstyle="secondary"
             ).pack(side=RIGHT)
 
-        # Add Goal Progress section below Recent Activity
-        goals_in_progress = [g for g in self.goals if not g.get('completed', False)]
-        achieved_goals = [g for g in self.goals if g.get('completed', False)]
-        
-        goals_frame = ttb.Labelframe(self.sidebar_content, text="Goal Progress", padding=10)
-        goals_frame.pack(fill=X, padx=5, pady=5)
+    def create_goal_progress_rows(self, parent):
+        goals_in_progress = [g for g in self.goals if not g.completed]
+        achieved_goals = [g for g in self.goals if g.completed]
         
         if not goals_in_progress and not achieved_goals:
             ttb.Label(
-                goals_frame,
+                parent,
                 text="No goals set yet",
                 font=("Helvetica", 10),
                 bootstyle="secondary"
             ).pack(pady=5)
             
             ttb.Button(
-                goals_frame,
+                parent,
                 text="+ Set New Goal",
                 command=self.add_goal_dialog,
                 bootstyle="success-outline",
@@ -1254,7 +4358,7 @@ class LifeManagerApp:
         else:
             # Show in-progress goals
             for goal in goals_in_progress:
-                goal_item = ttb.Frame(goals_frame)
+                goal_item = ttb.Frame(parent)
                 goal_item.pack(fill=X, pady=2)
                 
                 # Goal title and progress
@@ -1263,14 +4367,14 @@ class LifeManagerApp:
                 
                 ttb.Label(
                     title_frame,
-                    text=goal.get('title', 'Untitled Goal'),
+                    text=goal.title or 'Untitled Goal',
                     font=("Helvetica", 10),
                     bootstyle="primary"
                 ).pack(side=LEFT)
                 
                 ttb.Label(
                     title_frame,
-                    text=f"{goal.get('progress', 0)}%",
+                    text=f"{goal.progress or 0}%",
                     font=("Helvetica", 8),
                     bootstyle="success"
                 ).pack(side=RIGHT)
@@ -1278,7 +4382,7 @@ class LifeManagerApp:
                 # Progress bar
                 progress_bar = ttb.Progressbar(
                     goal_item,
-                    value=goal.get('progress', 0),
+                    value=goal.progress or 0,
                     bootstyle="success-striped"
                 )
                 progress_bar.pack(fill=X, pady=(2, 5))
@@ -1289,7 +4393,7 @@ class LifeManagerApp:
                 
                 ttb.Label(
                     bottom_frame,
-                    text=f"Target: {goal.get('target_date', 'No date')}",
+                    text=f"Target: {goal.target_date or 'No date'}",
                     font=("Helvetica", 8),
                     bootstyle="secondary"
                 ).pack(side=LEFT)
@@ -1304,36 +4408,20 @@ class LifeManagerApp:
 
     def show_tasks_sidebar(self):
         # Task Statistics
-        stats_frame = ttb.Labelframe(self.sidebar_content, text="Task Statistics", padding=10)
+        stats_frame = ttb.Labelframe(self.page_sidebar, text="Task Statistics", padding=10)
         stats_frame.pack(fill=X, padx=5, pady=5)
         
         stats = [
-            ("Total Tasks", len(self.tasks)),
-            ("Completed", len([t for t in self.tasks if t.get('completed', False)])),
-            ("Due Today", len([t for t in self.tasks if self.is_due_today(t)])),
-            ("Overdue", len([t for t in self.tasks if self.is_overdue(t)]))
+            ("Total Tasks", lambda: self.stats.tasks_total),
+            ("Completed", lambda: self.stats.tasks_completed),
+            ("Due Today", self.stats.due_today),
+            ("Overdue", self.stats.overdue)
         ]
         
-        for label, value in stats:
-            stat_item = ttb.Frame(stats_frame)
-            stat_item.pack(fill=X, pady=2)
-            
-            ttb.Label(
-                stat_item,
-                text=label,
-                font=("Helvetica", 10),
-                bootstyle="secondary"
-            ).pack(side=LEFT)
-            
-            ttb.Label(
-                stat_item,
-                text=str(value),
-                font=("Helvetica", 10, "bold"),
-                bootstyle="primary"
-            ).pack(side=RIGHT)
+        self.create_stat_rows(stats_frame, stats)
         
         # Quick Filters
-        filters_frame = ttb.Labelframe(self.sidebar_content, text="Quick Filters", padding=10)
+        filters_frame = ttb.Labelframe(self.page_sidebar, text="Quick Filters", padding=10)
         filters_frame.pack(fill=X, padx=5, pady=5)
         
         filters = [
@@ -1352,66 +4440,36 @@ class LifeManagerApp:
                 width=20
             ).pack(pady=2)
 
+    def filter_tasks(self, view):
+        """Show one of the Tasks page's tabs, keeping any search term"""
+        self.task_tabs.select(("all", "today", "upcoming", "completed").index(view))
+
     def show_goals_sidebar(self):
         # Goal Statistics
-        stats_frame = ttb.Labelframe(self.sidebar_content, text="Goal Statistics", padding=10)
+        stats_frame = ttb.Labelframe(self.page_sidebar, text="Goal Statistics", padding=10)
         stats_frame.pack(fill=X, padx=5, pady=5)
         
         stats = [
-            ("Total Goals", len(self.goals)),
-            ("In Progress", len([g for g in self.goals if not g.get('completed', False)])),
-            ("Achieved", len([g for g in self.goals if g.get('completed', False)]))
+            ("Total Goals", lambda: self.stats.goals_total),
+            ("In Progress", self.stats.goals_active),
+            ("Achieved", lambda: self.stats.goals_completed)
         ]
         
-        for label, value in stats:
-            stat_item = ttb.Frame(stats_frame)
-            stat_item.pack(fill=X, pady=2)
-            
-            ttb.Label(
-                stat_item,
-                text=label,
-                font=("Helvetica", 10),
-                bootstyle="secondary"
-            ).pack(side=LEFT)
-            
-            ttb.Label(
-                stat_item,
-                text=str(value),
-                font=("Helvetica", 10, "bold"),
-                bootstyle="primary"
-            ).pack(side=RIGHT)
+        self.create_stat_rows(stats_frame, stats)
         
         # Categories
-        categories_frame = ttb.Labelframe(self.sidebar_content, text="Categories", padding=10)
+        categories_frame = ttb.Labelframe(self.page_sidebar, text="Categories", padding=10)
         categories_frame.pack(fill=X, padx=5, pady=5)
         
-        categories = self.get_goal_categories()
-        
-        for category, count in categories.items():
-            category_item = ttb.Frame(categories_frame)
-            category_item.pack(fill=X, pady=2)
-            
-            ttb.Label(
-                category_item,
-                text=category,
-                font=("Helvetica", 10),
-                bootstyle="secondary"
-            ).pack(side=LEFT)
-            
-            ttb.Label(
-                category_item,
-                text=str(count),
-                font=("Helvetica", 10, "bold"),
-                bootstyle="primary"
-            ).pack(side=RIGHT)
+        self.live_section(categories_frame, ('goals',), self.create_category_rows)
 
     def show_calendar_sidebar(self):
         # Mini Calendar
-        calendar_frame = ttb.Labelframe(self.sidebar_content, text="Calendar", padding=10)
+        calendar_frame = ttb.Labelframe(self.page_sidebar, text="Calendar", padding=10)
         calendar_frame.pack(fill=X, padx=5, pady=5)
         
         # Current month and year
-        current_date = datetime.now()
+        current_date = self.clock.date
         month_year = current_date.strftime("%B %Y")
         
         header_frame = ttb.Frame(calendar_frame)
@@ -1466,35 +4524,21 @@ class LifeManagerApp:
 
     def show_analytics_sidebar(self):
         # Summary Statistics
-        stats_frame = ttb.Labelframe(self.sidebar_content, text="Summary", padding=10)
+        stats_frame = ttb.Labelframe(self.page_sidebar, text="Summary", padding=10)
         stats_frame.pack(fill=X, padx=5, pady=5)
         
         stats = [
-            ("Task Completion Rate", f"{self.calculate_completion_rate()}%"),
-            ("Active Goals", len([g for g in self.goals if not g.get('completed', False)])),
-            ("Tasks This Week", len([t for t in self.tasks if self.is_this_week(t)]))
+            ("Task Completion Rate", lambda: f"{self.calculate_completion_rate()}%"),
+            ("Active Goals", self.stats.goals_active),
+            ("Tasks This Week", self.stats.this_week),
+            ("Completion Streak", lambda: f"{self.rollup.streak(self.stats.current_day())} days"),
+            ("Chart Memory", self.charts.summary)
         ]
         
-        for label, value in stats:
-            stat_item = ttb.Frame(stats_frame)
-            stat_item.pack(fill=X, pady=2)
-            
-            ttb.Label(
-                stat_item,
-                text=label,
-                font=("Helvetica", 10),
-                bootstyle="secondary"
-            ).pack(side=LEFT)
-            
-            ttb.Label(
-                stat_item,
-                text=str(value),
-                font=("Helvetica", 10, "bold"),
-                bootstyle="primary"
-            ).pack(side=RIGHT)
+        self.create_stat_rows(stats_frame, stats)
         
         # Export Options
-        export_frame = ttb.Labelframe(self.sidebar_content, text="Export", padding=10)
+        export_frame = ttb.Labelframe(self.page_sidebar, text="Export", padding=10)
         export_frame.pack(fill=X, padx=5, pady=5)
         
         ttb.Button(
@@ -1515,13 +4559,15 @@ class LifeManagerApp:
 
     def show_settings_sidebar(self):
         # App Info
-        info_frame = ttb.Labelframe(self.sidebar_content, text="App Info", padding=10)
+        info_frame = ttb.Labelframe(self.page_sidebar, text="App Info", padding=10)
         info_frame.pack(fill=X, padx=5, pady=5)
         
         info = [
             ("Version", "1.2.0"),
             ("Last Update", "2024-02-20"),
-            ("Storage Used", "2.3 MB")
+            ("Storage Used", "2.3 MB"),
+            ("Startup Time", f"{self.startup.total():.0f} ms"),
+            ("Email Outbox", self.outbox_status())
         ]
         
         for label, value in info:
@@ -1535,15 +4581,29 @@ class LifeManagerApp:
                 bootstyle="secondary"
             ).pack(side=LEFT)
             
-            ttb.Label(
+            value_label = ttb.Label(
                 info_item,
                 text=value,
                 font=("Helvetica", 10, "bold"),
                 bootstyle="primary"
-            ).pack(side=RIGHT)
+            )
+            value_label.pack(side=RIGHT)
+            if label == "Email Outbox":
+                outbox_label = value_label
+        
+        # Mail is sent on the outbox's own thread, so its row is polled
+        # rather than repainted on store changes
+        
+        def refresh_outbox():
+            if not outbox_label.winfo_exists():
+                self.timers.cancel(outbox_job)
+            else:
+                outbox_label.configure(text=self.outbox_status())
+        
+        outbox_job = self.timers.every(2000, refresh_outbox, hidden=TimerWheel.PAUSE)
         
         # Quick Actions
-        actions_frame = ttb.Labelframe(self.sidebar_content, text="Quick Actions", padding=10)
+        actions_frame = ttb.Labelframe(self.page_sidebar, text="Quick Actions", padding=10)
         actions_frame.pack(fill=X, padx=5, pady=5)
         
         ttb.Button(
@@ -1562,64 +4622,122 @@ class LifeManagerApp:
             width=20
         ).pack(pady=2)
 
+    def outbox_status(self):
+        return self.outbox.status() if self.outbox is not None else "Off"
+
+    def create_stat_rows(self, parent, stats):
+        """Label/value rows whose value callables are re-read on each change"""
+        for label, value in stats:
+            stat_item = ttb.Frame(parent)
+            stat_item.pack(fill=X, pady=2)
+            
+            ttb.Label(
+                stat_item,
+                text=label,
+                font=("Helvetica", 10),
+                bootstyle="secondary"
+            ).pack(side=LEFT)
+            
+            value_label = ttb.Label(
+                stat_item,
+                text=str(value()),
+                font=("Helvetica", 10, "bold"),
+                bootstyle="primary"
+            )
+            value_label.pack(side=RIGHT)
+            self.watch(('tasks', 'goals'), lambda l=value_label, v=value: l.configure(text=str(v())))
+
+    def create_category_rows(self, parent):
+        for category, count in self.get_goal_categories().items():
+            category_item = ttb.Frame(parent)
+            category_item.pack(fill=X, pady=2)
+            
+            ttb.Label(
+                category_item,
+                text=category,
+                font=("Helvetica", 10),
+                bootstyle="secondary"
+            ).pack(side=LEFT)
+            
+            ttb.Label(
+                category_item,
+                text=str(count),
+                font=("Helvetica", 10, "bold"),
+                bootstyle="primary"
+            ).pack(side=RIGHT)
+
     def get_goal_categories(self):
-        categories = {}
-        for goal in self.goals:
-            category = goal.get('category', 'Uncategorized')
-            categories[category] = categories.get(category, 0) + 1
-        return categories
+        return dict(self.stats.categories)
 
     def calculate_completion_rate(self):
-        completed = len([t for t in self.tasks if t.get('completed', False)])
-        total = len(self.tasks)
-        return round((completed / total * 100) if total > 0 else 0)
+        return self.stats.completion_rate()
 
-    def is_this_week(self, task):
-        try:
-            task_date = datetime.strptime(task['date'], "%Y-%m-%d").date()
-            today = datetime.now().date()
-            monday = today - timedelta(days=today.weekday())
-            return monday <= task_date <= monday + timedelta(days=6)
-        except:
-            return False
+    def task_analytics(self):
+        """The task columns behind the charts, built on first use"""
+        if self.task_columns is None:
+            self.task_columns = TaskColumns(self.store)
+            self.store.subscribe(self.task_columns.record_changed)
+        return self.task_columns
+
+    def weekly_overview_data(self):
+        # This week's tasks by scheduled day, as hashable tuples for the chart
+        clock = self.clock
+        _, completed, total = self.task_analytics().completions(clock.week_start, clock.week_end)
+        dates = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+        return dates, (tuple(completed.tolist()), tuple(total.tolist()))
+
+    def goal_category_data(self):
+        categories = sorted(self.stats.categories.items())
+        return tuple(name for name, _ in categories), tuple(count for _, count in categories)
 
     def export_analytics(self):
         messagebox.showinfo("Export", "Analytics export feature coming soon!")
 
     def backup_data(self):
+        def write_backup(backup_data, backup_file):
+            write_json_atomic(backup_file, backup_data)
+            return backup_file
+        
+        def show_error(e):
+            messagebox.showerror("Error", f"Failed to backup data: {str(e)}")
+        
         try:
+            # Copied here, so edits made while the backup is written stay out of it
             backup_data = {
-                'tasks': self.tasks,
-                'goals': self.goals
+                'tasks': [t.to_dict() for t in self.tasks],
+                'goals': [g.to_dict() for g in self.goals]
             }
             
-            backup_file = f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            
-            with open(backup_file, 'w') as f:
-                json.dump(backup_data, f)
+            # Down to microseconds, so two quick clicks don't share a file
+            backup_file = f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}.json"
             
-            messagebox.showinfo("Success", f"Data backed up successfully to {backup_file}")
+            # Encoding and writing happen on a worker; every click gets its
+            # own backup, finished before the app exits
+            self.workers.submit(
+                write_backup, backup_data, backup_file,
+                done=lambda path: messagebox.showinfo("Success", f"Data backed up successfully to {path}"),
+                error=show_error,
+                priority=WorkerPool.LOW
+            )
             
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to backup data: {str(e)}")
+            show_error(e)
 
     def clear_all_data(self):
         if messagebox.askyesno("Confirm", "Are you sure you want to clear all data? This action cannot be undone."):
             try:
-                self.tasks = []
-                self.goals = []
-                self.save_data()
+                self.store.clear()
                 messagebox.showinfo("Success", "All data cleared successfully!")
                 self.show_dashboard()
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to clear data: {str(e)}")
 
     def show_analytics(self):
-        self.clear_content()
-        self.active_page = "analytics"
+        if self.raise_page("analytics"):
+            return
         
         # Create analytics layout
-        analytics_frame = ScrolledFrame(self.content_frame, bootstyle="rounded")
+        analytics_frame = ScrolledFrame(self.page_content, bootstyle="rounded")
         analytics_frame.pack(fill=BOTH, expand=YES)
         
         # Header
@@ -1637,60 +4755,43 @@ class LifeManagerApp:
         trends_frame = ttb.Labelframe(analytics_frame, text="Task Completion Trends", padding=15)
         trends_frame.pack(fill=X, padx=20, pady=10)
         
-        # Create a figure for the plot
-        fig, ax = plt.subplots(figsize=(10, 4))
-        
-        # Example data - replace with actual data
-        dates = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-        completed = [5, 3, 7, 4, 6, 2, 4]
-        total = [8, 5, 8, 6, 8, 4, 5]
-        
-        # Plot bars
-        x = range(len(dates))
-        width = 0.35
-        
-        ax.bar([i - width/2 for i in x], completed, width, label='Completed', color='#28a745')
-        ax.bar([i + width/2 for i in x], total, width, label='Total', color='#007bff')
-        
-        ax.set_xticks(x)
-        ax.set_xticklabels(dates)
-        ax.legend()
-        ax.set_title('Weekly Task Overview')
-        
-        # Embed the plot
-        canvas = FigureCanvasTkAgg(fig, master=trends_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=BOTH, expand=YES)
+        # The figure is kept by the chart engine and reused on every visit
+        weekly_chart = self.charts.bar(
+            'weekly_overview', (10, 4),
+            [('Completed', '#28a745'), ('Total', '#007bff')],
+            title='Weekly Task Overview'
+        )
+        weekly_chart.update(self.weekly_overview_data())
+        weekly_chart.attach(trends_frame).pack(fill=BOTH, expand=YES)
         
         # Goal Progress
         goals_frame = ttb.Labelframe(analytics_frame, text="Goal Progress", padding=15)
         goals_frame.pack(fill=X, padx=20, pady=10)
         
         # Create pie chart for goal categories
-        fig2, ax2 = plt.subplots(figsize=(6, 4))
-        
-        # Example data - replace with actual data
-        categories = ['Personal', 'Professional', 'Health', 'Financial']
-        sizes = [15, 30, 25, 30]
-        colors = ['#007bff', '#28a745', '#ffc107', '#dc3545']
+        category_chart = self.charts.pie(
+            'goal_categories', (6, 4),
+            ['#007bff', '#28a745', '#ffc107', '#dc3545']
+        )
+        category_chart.update(self.goal_category_data())
+        category_chart.attach(goals_frame).pack(side=LEFT, fill=BOTH, expand=YES)
         
-        ax2.pie(sizes, labels=categories, colors=colors, autopct='%1.1f%%', startangle=90)
-        ax2.axis('equal')
+        # Charts update their artists in place, and redraw only if the data moved
+        def update_charts():
+            weekly_chart.update(self.weekly_overview_data())
+            category_chart.update(self.goal_category_data())
         
-        # Embed the plot
-        canvas2 = FigureCanvasTkAgg(fig2, master=goals_frame)
-        canvas2.draw()
-        canvas2.get_tk_widget().pack(side=LEFT, fill=BOTH, expand=YES)
+        self.watch(('tasks', 'goals'), update_charts)
         
         # Update sidebar
         self.update_sidebar_content()
 
     def show_settings(self):
-        self.clear_content()
-        self.active_page = "settings"
+        if self.raise_page("settings"):
+            return
         
         # Create settings layout
-        settings_frame = ScrolledFrame(self.content_frame, bootstyle="rounded")
+        settings_frame = ScrolledFrame(self.page_content, bootstyle="rounded")
         settings_frame.pack(fill=BOTH, expand=YES)
         
         # Header
@@ -1733,7 +4834,7 @@ class LifeManagerApp:
         notif_frame.pack(fill=X, padx=20, pady=10)
         
         # Email notifications
-        email_var = tk.BooleanVar(value=True)
+        email_var = tk.BooleanVar(value=self.settings.get('email_notifications', True))
         ttb.Checkbutton(
             notif_frame,
             text="Enable email notifications",
@@ -1742,7 +4843,7 @@ class LifeManagerApp:
         ).pack(anchor=W, pady=5)
         
         # Desktop notifications
-        desktop_var = tk.BooleanVar(value=True)
+        desktop_var = tk.BooleanVar(value=self.settings.get('desktop_notifications', True))
         ttb.Checkbutton(
             notif_frame,
             text="Enable desktop notifications",
@@ -1768,14 +4869,25 @@ class LifeManagerApp:
     def save_settings(self, theme, email_notif, desktop_notif):
         # Save settings to configuration
         try:
-            settings = {
+            # Keep keys this page doesn't edit, such as storage_backend
+            settings = dict(self.settings)
+            settings.update({
                 'theme': theme,
                 'email_notifications': email_notif,
                 'desktop_notifications': desktop_notif
-            }
+            })
             
-            with open('settings.json', 'w') as f:
+            with open(SETTINGS_FILE, 'w') as f:
                 json.dump(settings, f)
+            self.settings = settings
+            
+            # Start or stop the email outbox to match
+            if email_notif and settings.get('email_to'):
+                if self.outbox is None:
+                    self.outbox = EmailOutbox(settings)
+            elif self.outbox is not None:
+                self.outbox.close()
+                self.outbox = None
             
             messagebox.showinfo("Success", "Settings saved successfully!")
             
@@ -1786,7 +4898,7 @@ class LifeManagerApp:
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save settings: {str(e)}")
 
-    def create_todays_schedule(self, parent, today_tasks):
+    def create_todays_schedule(self, parent):
         # Create a more visually appealing schedule card
         schedule_frame = ttb.Labelframe(
             parent,
@@ -1823,18 +4935,42 @@ class LifeManagerApp:
         search_entry.bind("<FocusOut>", on_entry_blur)
         
         # Add filter function
-        def filter_tasks():
-            search_term = search_var.get().lower()
-            if search_term == "search tasks...":
-                search_term = ""
+        def search_query():
+            search_term = search_var.get().lower().strip()
+            return "" if search_term == "search tasks..." else search_term
+        
+        def filter_tasks(search_term):
+            # Today's tasks come from the date index already in time order
+            filters = {'date': self.clock.iso}
+            if search_term:
+                filters['ids'] = self.search_index.search('tasks', search_term)
+            return self.store.find_tasks(**filters)
+        
+        def show_results(tasks, first):
+            if first:
+                # Clear existing task items
+                for widget in task_list_frame.winfo_children():
+                    widget.destroy()
+            
+            if first and not tasks and not self.stats.due_today():
+                empty_frame = ttb.Frame(task_list_frame, bootstyle="light")
+                empty_frame.pack(fill=X, pady=20)
                 
-            # Clear existing task items
-            for widget in task_list_frame.winfo_children():
-                widget.destroy()
+                ttb.Label(
+                    empty_frame,
+                    text="No tasks scheduled for today",
+                    font=("Helvetica", 12),
+                    bootstyle="secondary"
+                ).pack(expand=True)
                 
-            filtered_tasks = [t for t in today_tasks if search_term in t.get('title', '').lower()]
-            
-            if not filtered_tasks:
+                # Add "quick add" button for empty state
+                ttb.Button(
+                    empty_frame,
+                    text="+ Add Task",
+                    command=self.add_task_dialog,
+                    bootstyle="info"
+                ).pack(pady=10)
+            elif first and not tasks:
                 empty_frame = ttb.Frame(task_list_frame, bootstyle="light")
                 empty_frame.pack(fill=X, pady=20)
                 
@@ -1845,20 +4981,25 @@ class LifeManagerApp:
                     bootstyle="secondary"
                 ).pack(expand=True)
             else:
-                try:
-                    sorted_tasks = self.sort_tasks_by_time(filtered_tasks)
-                    for task in sorted_tasks:
-                        self.create_enhanced_task_item(task_list_frame, task)
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to sort tasks: {str(e)}")
-                    for task in filtered_tasks:
-                        self.create_enhanced_task_item(task_list_frame, task)
+                for task in tasks:
+                    self.create_enhanced_task_item(task_list_frame, task)
+        
+        # Each task here is a full widget tree, so draw them a batch at a time
+        search = SearchPipeline(
+            self.root,
+            search_query,
+            filter_tasks,
+            show_results,
+            delay=self.settings.get('search_debounce_ms', 150),
+            batch=10
+        )
+        search_var.trace_add('write', search.request)
         
         # Add search button
         ttb.Button(
             filter_frame,
             text="Search",
-            command=filter_tasks,
+            command=search.run_now,
             bootstyle="info-outline"
         ).pack(side=LEFT, padx=5)
         
@@ -1882,33 +5023,9 @@ class LifeManagerApp:
         task_list_frame = ttb.Frame(schedule_frame)
         task_list_frame.pack(fill=BOTH, expand=YES)
         
-        if not today_tasks:
-            empty_frame = ttb.Frame(task_list_frame, bootstyle="light")
-            empty_frame.pack(fill=X, pady=20)
-            
-            ttb.Label(
-                empty_frame,
-                text="No tasks scheduled for today",
-                font=("Helvetica", 12),
-                bootstyle="secondary"
-            ).pack(expand=True)
-            
-            # Add "quick add" button for empty state
-            ttb.Button(
-                empty_frame,
-                text="+ Add Task",
-                command=self.add_task_dialog,
-                bootstyle="info"
-            ).pack(pady=10)
-        else:
-            try:
-                sorted_tasks = self.sort_tasks_by_time(today_tasks)
-                for task in sorted_tasks:
-                    self.create_enhanced_task_item(task_list_frame, task)
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to sort tasks: {str(e)}")
-                for task in today_tasks:
-                    self.create_enhanced_task_item(task_list_frame, task)
+        # Only this list is redrawn when tasks change
+        search.run_now()
+        self.watch(('tasks',), search.run_now)
 
     def create_productivity_chart(self, parent):
         # Create chart frame
@@ -1920,52 +5037,84 @@ class LifeManagerApp:
         )
         chart_frame.pack(fill=BOTH, expand=YES, pady=10)
         
-        # Get task completion data for the last 7 days
-        today = datetime.now().date()
-        days = [(today - timedelta(days=i)) for i in range(6, -1, -1)]
-        day_names = [day.strftime("%a") for day in days]
-        
-        # Get completed tasks per day
-        completed_counts = []
-        for day in days:
-            day_str = day.strftime("%Y-%m-%d")
-            count = len([t for t in self.tasks if t.get('completed', False) and 
-                        t.get('completion_date', '') == day_str])
-            completed_counts.append(count)
-        
-        # Create matplotlib figure for the chart
-        fig, ax = plt.subplots(figsize=(5, 3), dpi=100)
-        ax.bar(day_names, completed_counts, color='#1E88E5')
-        ax.set_title('Tasks Completed Last 7 Days')
-        ax.set_ylabel('Completed Tasks')
-        ax.grid(axis='y', linestyle='--', alpha=0.7)
-        
-        # Create colorful threshold line for daily goal
-        daily_goal = 3  # Example: 3 tasks per day goal
-        ax.axhline(y=daily_goal, color='#FF5722', linestyle='--', alpha=0.8)
-        ax.text(0, daily_goal + 0.2, 'Daily Goal', color='#FF5722')
-        
-        # Embed the chart in Tkinter frame
-        canvas = FigureCanvasTkAgg(fig, master=chart_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=BOTH, expand=YES)
+        # Persistent figure; the goal line is re-added if the axes are rebuilt
+        def add_daily_goal(ax):
+            ax.set_ylabel('Completed Tasks')
+            ax.grid(axis='y', linestyle='--', alpha=0.7)
+            
+            # Create colorful threshold line for daily goal
+            daily_goal = 3  # Example: 3 tasks per day goal
+            ax.axhline(y=daily_goal, color='#FF5722', linestyle='--', alpha=0.8)
+            ax.text(0, daily_goal + 0.2, 'Daily Goal', color='#FF5722')
+        
+        # Completions come from the daily rollup, so each range reads one
+        # entry per day rather than scanning every task
+        def last_days(span, label_format):
+            today = self.stats.current_day()
+            days = range(today - span + 1, today + 1)
+            labels = tuple(date.fromordinal(day).strftime(label_format) for day in days)
+            return labels, (self.rollup.completed(days[0], today),)
+        
+        def by_category():
+            today = self.stats.current_day()
+            categories = sorted(self.rollup.by_category(today - 29, today).items())
+            return tuple(name for name, _ in categories), (tuple(count for _, count in categories),)
+        
+        # One kept figure per option, so switching back redraws nothing
+        chart_options = {
+            "Last 7 Days": (
+                lambda: self.charts.bar('productivity', (5, 3), [('Completed', '#1E88E5')],
+                                        title='Tasks Completed Last 7 Days', setup=add_daily_goal),
+                lambda: last_days(7, "%a")
+            ),
+            "Last 30 Days": (
+                lambda: self.charts.bar('productivity_30', (5, 3), [('Completed', '#1E88E5')],
+                                        title='Tasks Completed Last 30 Days', setup=add_daily_goal),
+                lambda: last_days(30, "%d")
+            ),
+            "By Category": (
+                lambda: self.charts.bar('productivity_category', (5, 3), [('Completed', '#43A047')],
+                                        title='Tasks Completed by Category, Last 30 Days'),
+                by_category
+            )
+        }
+        chart_var = tk.StringVar(value="Last 7 Days")
+        placeholder = ttb.Label(chart_frame, text="Loading chart...", anchor="center")
+        placeholder.pack(fill=BOTH, expand=YES)
+        shown = [placeholder]
         
         # Add chart selector
         chart_selector_frame = ttb.Frame(chart_frame)
         chart_selector_frame.pack(fill=X, pady=(10, 0))
         
-        # Different chart options
-        chart_options = ["Last 7 Days", "Last 30 Days", "By Category"]
-        chart_var = tk.StringVar(value=chart_options[0])
-        
-        for i, option in enumerate(chart_options):
+        def show_chart():
+            # Until the import finishes, the pending first draw covers this
+            if not self.charts_ready.is_set():
+                return
+            make_chart, chart_data = chart_options[chart_var.get()]
+            chart = make_chart()
+            chart.update(chart_data())
+            widget = chart.attach(chart_frame)
+            if shown and shown[0] is not widget:
+                shown.pop().pack_forget()
+            if not shown:
+                widget.pack(fill=BOTH, expand=YES, before=chart_selector_frame)
+                shown.append(widget)
+        
+        for option in chart_options:
             ttb.Radiobutton(
                 chart_selector_frame,
                 text=option,
                 variable=chart_var,
                 value=option,
+                command=show_chart,
                 bootstyle="primary-toolbutton"
             ).pack(side=LEFT, padx=5)
+        
+        # The dashboard is the first page, so the first figure waits for the
+        # background import instead of blocking the window on it
+        self.when_charts_ready(show_chart)
+        self.watch(('tasks',), show_chart)
 
     def create_upcoming_deadlines(self, parent):
         # Create upcoming deadlines section
@@ -1978,27 +5127,19 @@ class LifeManagerApp:
         deadlines_frame.pack(fill=BOTH, expand=YES, pady=10)
         
         # Get tasks with upcoming deadlines (within next 7 days)
-        today = datetime.now().date()
+        today = self.clock.today
         upcoming_tasks = []
         
         for task in self.tasks:
-            if task.get('completed', False):
-                continue
-                
-            try:
-                due_date_str = task.get('due_date', '')
-                if due_date_str:
-                    due_date = datetime.strptime(due_date_str, "%Y-%m-%d").date()
-                    days_remaining = (due_date - today).days
-                    
-                    if 0 <= days_remaining <= 7:
-                        task['days_remaining'] = days_remaining
-                        upcoming_tasks.append(task)
-            except ValueError:
+            if task.completed or task.due_ord is None:
                 continue
+            
+            days_remaining = task.due_ord - today
+            if 0 <= days_remaining <= 7:
+                upcoming_tasks.append((days_remaining, task))
         
         # Sort by days remaining
-        upcoming_tasks.sort(key=lambda x: x.get('days_remaining', 0))
+        upcoming_tasks.sort(key=lambda item: item[0])
         
         # Display upcoming deadlines
         if not upcoming_tasks:
@@ -2016,8 +5157,7 @@ class LifeManagerApp:
             deadlines_list = ScrolledFrame(deadlines_frame, bootstyle="rounded")
             deadlines_list.pack(fill=BOTH, expand=YES)
             
-            for task in upcoming_tasks:
-                days = task.get('days_remaining', 0)
+            for days, task in upcoming_tasks:
                 
                 # Create deadline item frame
                 deadline_frame = ttb.Frame(deadlines_list, bootstyle="light")
@@ -2029,7 +5169,7 @@ class LifeManagerApp:
                 
                 ttb.Label(
                     left_content,
-                    text=task.get('title', 'Untitled Task'),
+                    text=task.title or 'Untitled Task',
                     font=("Helvetica", 12, "bold"),
                     bootstyle="dark"
                 ).pack(anchor="w")
@@ -2084,9 +5224,9 @@ class LifeManagerApp:
             
             # Process and show in-progress goals first
             for goal in goals_in_progress:
-                title = goal.get('title', 'Untitled Goal')
-                target_date_str = goal.get('target_date', 'No target date')
-                progress = goal.get('progress', 0)
+                title = goal.title or 'Untitled Goal'
+                target_date_str = goal.target_date or 'No target date'
+                progress = goal.progress or 0
                 
                 # Create goal progress item
                 goal_frame = ttb.Frame(goals_list, bootstyle="light")
@@ -2150,12 +5290,12 @@ class LifeManagerApp:
         # Goal title display
         ttb.Label(
             form_frame,
-            text=goal.get('title', 'Update Goal Progress'),
+            text=goal.title or 'Update Goal Progress',
             font=("Helvetica", 14, "bold")
         ).pack(fill=X, pady=(0, 20))
         
         # Current progress display
-        current_progress = goal.get('progress', 0)
+        current_progress = goal.progress or 0
         ttb.Label(
             form_frame,
             text=f"Current Progress: {current_progress}%",
@@ -2202,17 +5342,11 @@ class LifeManagerApp:
         
         # Save button
         def save_progress():
-            # Update the goal progress
-            goal['progress'] = progress_var.get()
-            
-            # Set completed if 100%
-            if progress_var.get() == 100:
-                goal['completed'] = True
-            else:
-                goal['completed'] = False
+            # Update the goal progress, completed if 100%
+            progress = progress_var.get()
                 
             # Save data and refresh the dashboard
-            self.save_data()
+            self.persist('update', 'goals', goal.id, progress=progress, completed=progress == 100)
             self.show_dashboard()
             dialog.destroy()
         
@@ -2223,22 +5357,10 @@ class LifeManagerApp:
             bootstyle="success"
         ).pack(side=RIGHT, padx=5)
 
-    def sort_tasks_by_time(self, tasks):
-        def get_time_value(task):
-            try:
-                time_str = task.get('time', '00:00')
-                if ':' not in time_str:
-                    return datetime.strptime('00:00', '%H:%M')
-                return datetime.strptime(time_str, '%H:%M')
-            except ValueError:
-                return datetime.strptime('00:00', '%H:%M')
-        
-        return sorted(tasks, key=get_time_value)
-
     def create_enhanced_task_item(self, parent, task):
         # Determine task priority and set appropriate styling
-        priority = task.get('priority', 'Medium')
-        completed = task.get('completed', False)
+        priority = task.priority or 'Medium'
+        completed = bool(task.completed)
         
         # Set color based on priority and completion status
         if completed:
@@ -2269,7 +5391,7 @@ class LifeManagerApp:
         content.pack(side=LEFT, fill=BOTH, expand=YES)
         
         # Title with strikethrough if completed
-        title_text = task.get('title', 'Untitled Task')
+        title_text = task.title or 'Untitled Task'
         if completed:
             title_text = "✓ " + title_text
         
@@ -2283,7 +5405,7 @@ class LifeManagerApp:
         title.pack(anchor=W, pady=(0, 5))
         
         # Description (if available)
-        description = task.get('description', '').strip()
+        description = (task.description or '').strip()
         if description:
             desc_label = ttb.Label(
                 content,
@@ -2298,13 +5420,9 @@ class LifeManagerApp:
         info_frame.pack(fill=X, pady=(5, 0), anchor=W)
         
         # Format time nicely
-        time_str = task.get('time', '')
-        if time_str:
-            try:
-                time_obj = datetime.strptime(time_str, '%H:%M')
-                time_str = time_obj.strftime('%I:%M %p')
-            except ValueError:
-                pass
+        time_str = task.time or ''
+        if task.time_min is not None:
+            time_str = format_minutes(task.time_min)
         
         # Add time label
         time_label = ttb.Label(
@@ -2336,7 +5454,7 @@ class LifeManagerApp:
                 btn_frame,
                 text="Complete",
                 bootstyle="success-outline",
-                command=lambda: self.complete_task(task),
+                command=lambda: self.complete_task(task.id),
                 width=9
             )
             complete_btn.pack(side=TOP, pady=5)
@@ -2345,7 +5463,7 @@ class LifeManagerApp:
             btn_frame,
             text="Delete",
             bootstyle="danger-outline",
-            command=lambda: self.delete_task(task),
+            command=lambda: self.delete_task(task.id),
             width=9
         )
         delete_btn.pack(side=TOP, pady=5)
@@ -2356,96 +5474,27 @@ class LifeManagerApp:
             widget.bind("<Enter>", lambda e, tf=task_frame: self.on_task_hover(tf, True))
             widget.bind("<Leave>", lambda e, tf=task_frame: self.on_task_hover(tf, False))
 
-    def render_task_list(self, container):
-        # Clear previous items
-        for widget in container.winfo_children():
-            widget.destroy()
-        
-        if not self.filtered_tasks:
-            empty_frame = ttb.Frame(container)
-            empty_frame.pack(fill=BOTH, expand=YES, pady=50)
-            
-            # No tasks message with icon
-            no_tasks_label = ttb.Label(
-                empty_frame,
-                text="No tasks found",
-                font=("Helvetica", 14),
-                bootstyle="secondary"
-            )
-            no_tasks_label.pack(pady=20)
-            
-            # Add suggestion
-            suggestion_label = ttb.Label(
-                empty_frame,
-                text="Click on '+ New Task' to create a task",
-                font=("Helvetica", 11),
-                bootstyle="secondary"
-            )
-            suggestion_label.pack()
-            return
-        
-        # Sort tasks by date and time
-        def get_datetime_value(task):
-            try:
-                date_str = task.get('date', datetime.now().strftime('%Y-%m-%d'))
-                time_str = task.get('time', '00:00')
-                if ':' not in time_str:
-                    time_str = '00:00'
-                return datetime.strptime(f"{date_str} {time_str}", '%Y-%m-%d %H:%M')
-            except ValueError:
-                return datetime.max
-        
-        try:
-            sorted_tasks = sorted(self.filtered_tasks, key=get_datetime_value)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to sort tasks: {str(e)}")
-            sorted_tasks = self.filtered_tasks
-        
-        # Group tasks by date
-        task_groups = {}
-        for task in sorted_tasks:
-            date_str = task.get('date')
-            if date_str not in task_groups:
-                task_groups[date_str] = []
-            task_groups[date_str].append(task)
-        
-        # Create task items grouped by date
-        for date_str, tasks in task_groups.items():
-            try:
-                date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-                date_header = date_obj.strftime('%A, %B %d, %Y')
+    def render_task_list(self, container, query=None):
+        # Filtered tasks keep the index's date and time order, so grouping
+        # them is a single pass over the visible results
+        rows = []
+        clock = self.clock
+        for date_ord, tasks in group_by_date(self.filtered_tasks):
+            # Undated tasks are listed without a heading
+            if date_ord is not None:
+                date_header = date.fromordinal(date_ord).strftime('%A, %B %d, %Y')
                 
                 # Check if date is today
-                if date_str == datetime.now().strftime('%Y-%m-%d'):
+                if date_ord == clock.today:
                     date_header += " (Today)"
                 # Check if date is tomorrow
-                elif date_str == (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d'):
+                elif date_ord == clock.tomorrow:
                     date_header += " (Tomorrow)"
-                
-                # Create date header
-                date_frame = ttb.Frame(container)
-                date_frame.pack(fill=X, pady=(15, 5))
-                
-                date_label = ttb.Label(
-                    date_frame,
-                    text=date_header,
-                    font=("Helvetica", 12, "bold"),
-                    bootstyle="secondary"
-                )
-                date_label.pack(anchor=W, padx=5)
-                
-                # Add separator
-                separator = ttb.Separator(container)
-                separator.pack(fill=X, padx=5, pady=5)
-                
-                # Add tasks for this date
-                for task in tasks:
-                    self.create_task_item(container, task)
-                    
-            except Exception as e:
-                # If date parsing fails, just show the tasks
-                for task in tasks:
-                    self.create_task_item(container, task)
+                rows.append(('header', date_header))
+            rows.extend(('task', task) for task in tasks)
+        
+        # Only rows scrolled into view get widgets
+        container.set_rows(rows, query)
 
     def on_task_hover(self, task_frame, is_hover):
         if is_hover:
@@ -2468,18 +5517,18 @@ class LifeManagerApp:
         
         title_label = ttb.Label(
             title_frame,
-            text=task.get('title', 'Untitled Task'),
+            text=task.title or 'Untitled Task',
             font=("Helvetica", 16, "bold")
         )
         title_label.pack(anchor=W)
         
         # Status indicator
-        status_text = "✅ Completed" if task.get('completed', False) else "⏳ In Progress"
+        status_text = "✅ Completed" if task.completed else "⏳ In Progress"
         status_label = ttb.Label(
             title_frame,
             text=status_text,
             font=("Helvetica", 12),
-            bootstyle="success" if task.get('completed', False) else "warning"
+            bootstyle="success" if task.completed else "warning"
         )
         status_label.pack(anchor=W, pady=(5, 0))
         
@@ -2498,23 +5547,17 @@ class LifeManagerApp:
         date_frame = ttb.Labelframe(left_col, text="Date & Time", padding=10)
         date_frame.pack(fill=X, pady=(0, 10))
         
-        date_str = task.get('date', '')
-        try:
-            date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-            formatted_date = date_obj.strftime('%A, %B %d, %Y')
-        except:
-            formatted_date = date_str
+        if task.date_ord is not None:
+            formatted_date = date.fromordinal(task.date_ord).strftime('%A, %B %d, %Y')
+        else:
+            formatted_date = task.date or ''
         
         date_label = ttb.Label(date_frame, text=formatted_date)
         date_label.pack(anchor=W)
         
-        time_str = task.get('time', '')
-        if time_str:
-            try:
-                time_obj = datetime.strptime(time_str, '%H:%M')
-                time_str = time_obj.strftime('%I:%M %p')
-            except:
-                pass
+        time_str = task.time or ''
+        if task.time_min is not None:
+            time_str = format_minutes(task.time_min)
                 
         if time_str:
             time_label = ttb.Label(date_frame, text=time_str)
@@ -2524,7 +5567,7 @@ class LifeManagerApp:
         priority_frame = ttb.Labelframe(left_col, text="Priority", padding=10)
         priority_frame.pack(fill=X)
         
-        priority = task.get('priority', 'Medium')
+        priority = task.priority or 'Medium'
         priority_label = ttb.Label(
             priority_frame, 
             text=priority,
@@ -2537,7 +5580,7 @@ class LifeManagerApp:
         desc_frame = ttb.Labelframe(right_col, text="Description", padding=10)
         desc_frame.pack(fill=BOTH, expand=YES)
         
-        description = task.get('description', '').strip()
+        description = (task.description or '').strip()
         if not description:
             description = "No description provided."
             
@@ -2550,11 +5593,11 @@ class LifeManagerApp:
         btn_frame = ttb.Frame(main_frame)
         btn_frame.pack(fill=X, pady=(20, 0))
         
-        if not task.get('completed', False):
+        if not task.completed:
             complete_btn = ttb.Button(
                 btn_frame,
                 text="Mark as Completed",
-                command=lambda: [self.complete_task(task), dialog.destroy()],
+                command=lambda: [self.complete_task(task.id), dialog.destroy()],
                 bootstyle="success"
             )
             complete_btn.pack(side=LEFT, padx=(0, 10))
@@ -2562,7 +5605,7 @@ class LifeManagerApp:
         edit_btn = ttb.Button(
             btn_frame,
             text="Edit Task",
-            command=lambda: [dialog.destroy(), self.edit_task(task)],
+            command=lambda: [dialog.destroy(), self.edit_task(task.id)],
             bootstyle="info"
         )
         edit_btn.pack(side=LEFT, padx=(0, 10))
@@ -2570,7 +5613,7 @@ class LifeManagerApp:
         delete_btn = ttb.Button(
             btn_frame,
             text="Delete Task",
-            command=lambda: [dialog.destroy(), self.delete_task(task)],
+            command=lambda: [dialog.destroy(), self.delete_task(task.id)],
             bootstyle="danger"
         )
         delete_btn.pack(side=LEFT)
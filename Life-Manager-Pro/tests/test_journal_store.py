@@ -0,0 +1,106 @@
+import json
+
+import pytest
+
+from life_manager import JournalStore, Task, Goal
+
+
+def open_store(tmp_path, **options):
+    store = JournalStore(
+        path=str(tmp_path / 'data.json'),
+        journal_path=str(tmp_path / 'data.journal'),
+        **options
+    )
+    store.load()
+    return store
+
+
+def titles(store, kind='tasks'):
+    return [record.title for record in store.records(kind).values()]
+
+
+def test_journal_replays_on_top_of_snapshot(tmp_path):
+    store = open_store(tmp_path)
+    first = store.add('tasks', Task(title="Write report", date='2024-03-01'))
+    store.add('tasks', Task(title="Call Sam"))
+    store.add('goals', Goal(title="Run 10k", progress=0))
+    store.update('tasks', first.id, completed=True)
+    store.remove('tasks', store.find_tasks(date=None)[-1].id)
+    
+    reloaded = open_store(tmp_path)
+    assert titles(reloaded) == ["Write report"]
+    assert reloaded.get('tasks', first.id).completed is True
+    assert titles(reloaded, 'goals') == ["Run 10k"]
+    assert reloaded.revision == store.revision
+
+
+def test_compaction_writes_snapshot_and_drops_journal(tmp_path):
+    store = open_store(tmp_path, compact_after=3)
+    for i in range(3):
+        store.add('tasks', Task(title=f"Task {i}"))
+    
+    assert not (tmp_path / 'data.journal').exists()
+    snapshot = json.loads((tmp_path / 'data.json').read_text())
+    assert [t['title'] for t in snapshot['tasks']] == ["Task 0", "Task 1", "Task 2"]
+    
+    store.add('tasks', Task(title="Task 3"))
+    assert titles(open_store(tmp_path)) == ["Task 0", "Task 1", "Task 2", "Task 3"]
+
+
+def test_journal_left_by_interrupted_compaction_is_not_replayed(tmp_path):
+    store = open_store(tmp_path)
+    store.add('tasks', Task(title="Once"))
+    journal = (tmp_path / 'data.journal').read_text()
+    store.close()
+    # The snapshot was written but the journal not yet removed
+    (tmp_path / 'data.journal').write_text(journal)
+    
+    assert titles(open_store(tmp_path)) == ["Once"]
+
+
+def test_truncated_journal_tail_is_ignored(tmp_path):
+    store = open_store(tmp_path)
+    store.add('tasks', Task(title="Kept"))
+    store.add('tasks', Task(title="Lost"))
+    journal = tmp_path / 'data.journal'
+    lines = journal.read_text().splitlines(keepends=True)
+    # A crash mid-append leaves half of the last line
+    journal.write_text(lines[0] + lines[1][:len(lines[1]) // 2])
+    
+    reloaded = open_store(tmp_path)
+    assert titles(reloaded) == ["Kept"]
+    # New changes go after the last complete entry
+    reloaded.add('tasks', Task(title="After"))
+    assert titles(open_store(tmp_path)) == ["Kept", "After"]
+
+
+def test_change_is_journaled_before_observers_run(tmp_path):
+    store = open_store(tmp_path)
+    
+    def failing_observer(event, kind, record, old):
+        raise RuntimeError("view failed")
+    
+    store.subscribe(failing_observer)
+    with pytest.raises(RuntimeError):
+        store.add('tasks', Task(title="Saved anyway"))
+    
+    assert titles(open_store(tmp_path)) == ["Saved anyway"]
+
+
+def test_revision_is_kept_across_reloads_but_not_reused_after_a_lost_tail(tmp_path):
+    store = open_store(tmp_path)
+    for title in ("One", "Two", "Three"):
+        store.add('tasks', Task(title=title))
+    saved = store.revision
+    assert open_store(tmp_path).revision == saved
+    
+    # A crash loses the last entry, and a different change takes its seq
+    journal = tmp_path / 'data.journal'
+    journal.write_text(''.join(journal.read_text().splitlines(keepends=True)[:2]))
+    reloaded = open_store(tmp_path)
+    reloaded.add('tasks', Task(title="Other"))
+    assert reloaded.seq == store.seq
+    assert reloaded.revision != saved
+    
+    reloaded.close()
+    assert open_store(tmp_path).revision == reloaded.revision
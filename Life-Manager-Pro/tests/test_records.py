@@ -0,0 +1,56 @@
+import json
+import tracemalloc
+
+from life_manager import Task, Goal, new_record_id
+
+
+def typical_task(i):
+    return {
+        'id': new_record_id(),
+        'title': f"Task {i}",
+        'date': f"2024-03-{i % 28 + 1:02d}",
+        'time': "09:30",
+        'priority': "High",
+        'description': "Something to do",
+        'completed': i % 2 == 0,
+        'created_date': "2024-02-01"
+    }
+
+
+def test_round_trip_keeps_nulls_missing_fields_and_unknown_keys():
+    source = {
+        'id': 'a1',
+        'title': "Plan trip",
+        'date': None,
+        'category': None,
+        'completed': False,
+        'color': "teal",
+        'tags': ["travel"]
+    }
+    task = Task.from_dict(source)
+    assert task.to_dict() == source
+    assert task.copy().to_dict() == source
+    # Missing fields read as None without appearing in the output
+    assert task.time is None and task.time_min is None and task.date_ord is None
+    
+    goal = {'title': "Learn Go", 'target_date': "2024-12-31", 'milestones': None}
+    assert Goal.from_dict(goal).to_dict() == goal
+
+
+def test_typical_records_keep_no_extra_dict():
+    task = Task.from_dict(typical_task(1))
+    assert task.extra is None
+    assert json.loads(json.dumps(task.to_dict())) == task.to_dict()
+
+
+def test_task_is_smaller_than_the_dict_it_replaces():
+    sources = [json.loads(json.dumps(typical_task(i))) for i in range(5000)]
+    
+    def per_object(make):
+        tracemalloc.start()
+        objects = [make(source) for source in sources]
+        size = tracemalloc.get_traced_memory()[0] / len(objects)
+        tracemalloc.stop()
+        return size
+    
+    assert per_object(Task.from_dict) < 0.75 * per_object(dict)
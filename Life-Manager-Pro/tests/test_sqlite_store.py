@@ -0,0 +1,127 @@
+import json
+import sqlite3
+import random
+from datetime import date, timedelta
+
+from life_manager import JournalStore, SqliteStore, WriteBehindSaver, Task, Goal
+
+
+def sample_tasks(count=300, seed=7):
+    rng = random.Random(seed)
+    today = date.today()
+    tasks = []
+    for i in range(count):
+        day = today + timedelta(days=rng.randint(-20, 20))
+        tasks.append({
+            'id': f"t{i}",
+            'title': f"Task {i}",
+            'date': rng.choice([day.isoformat(), day.isoformat(), "", None, "someday"]),
+            'time': rng.choice(["08:30", "17:00", None]),
+            'priority': rng.choice(["High", "Medium", "Low"]),
+            'category': rng.choice(["Work", "Home", None]),
+            'completed': rng.random() < 0.3
+        })
+    return tasks
+
+
+def sample_goals():
+    return [
+        {'id': 'g1', 'title': "Read", 'category': "Learning", 'completed': False},
+        {'id': 'g2', 'title': "Save", 'category': "", 'completed': True},
+        {'id': 'g3', 'title': "Run", 'completed': False}
+    ]
+
+
+def open_both(tmp_path):
+    (tmp_path / 'data.json').write_text(json.dumps({'tasks': sample_tasks(), 'goals': sample_goals()}))
+    journal = JournalStore(path=str(tmp_path / 'data.json'), journal_path=str(tmp_path / 'data.journal'))
+    journal.load()
+    sqlite = SqliteStore(path=str(tmp_path / 'data.db'), migrate_from=str(tmp_path / 'data.json'))
+    sqlite.load()
+    return journal, sqlite
+
+
+def ids(tasks):
+    return [task.id for task in tasks]
+
+
+def test_queries_match_the_in_memory_store(tmp_path):
+    journal, sqlite = open_both(tmp_path)
+    today = date.today().isoformat()
+    queries = [
+        {},
+        {'date': today},
+        {'after': today},
+        {'before': today, 'completed': False},
+        {'completed': True},
+        {'priority': "High"},
+        {'after': today, 'priority': "Low", 'completed': False},
+        {'ids': {'t1', 't2', 't50', 'missing'}},
+        {'ids': {f"t{i}" for i in range(0, 300, 2)}, 'date': today}
+    ]
+    for query in queries:
+        assert ids(sqlite.find_tasks(**query)) == ids(journal.find_tasks(**query)), query
+
+
+def test_stats_match_the_in_memory_store(tmp_path):
+    journal, sqlite = open_both(tmp_path)
+    for name in ('tasks_total', 'tasks_completed', 'goals_total', 'goals_completed', 'categories'):
+        assert getattr(sqlite.stats, name) == getattr(journal.stats, name), name
+    for name in ('due_today', 'overdue', 'this_week', 'goals_active', 'completion_rate'):
+        assert getattr(sqlite.stats, name)() == getattr(journal.stats, name)(), name
+
+
+def test_changes_are_queried_back_and_survive_reopening(tmp_path):
+    _, sqlite = open_both(tmp_path)
+    today = date.today().isoformat()
+    revision = sqlite.revision
+    added = sqlite.add('tasks', Task(title="New", date=today, priority="High"))
+    assert sqlite.revision != revision
+    sqlite.update('tasks', added.id, completed=True)
+    sqlite.remove('tasks', 't1')
+    sqlite.add('goals', Goal(title="Swim", category="Health"))
+    sqlite.close()
+    
+    reopened = SqliteStore(path=str(tmp_path / 'data.db'), migrate_from=None)
+    reopened.load()
+    assert reopened.revision == sqlite.revision
+    assert added.id in ids(reopened.find_tasks(date=today, completed=True, priority="High"))
+    assert 't1' not in reopened.task_map
+    assert reopened.stats.categories['Health'] == 1
+
+
+def test_load_keeps_nothing_in_memory_and_queries_use_indexes(tmp_path):
+    _, sqlite = open_both(tmp_path)
+    assert not isinstance(sqlite.task_map, dict)
+    names = {row[0] for row in sqlite.conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {'tasks_date', 'tasks_completed', 'tasks_priority', 'tasks_category',
+            'goals_completed', 'goals_category'} <= names
+    plan = sqlite.conn.execute(
+        "EXPLAIN QUERY PLAN SELECT data FROM tasks WHERE date = ?", (date.today().isoformat(),)
+    ).fetchall()
+    assert 'tasks_date' in str(plan)
+
+
+class ManualRoot:
+    """Stands in for Tk's after(), running nothing until asked"""
+
+    def after(self, delay, callback):
+        return callback
+
+    def after_cancel(self, job):
+        pass
+
+
+def test_changes_are_committed_by_the_saver(tmp_path):
+    _, sqlite = open_both(tmp_path)
+    saver = WriteBehindSaver(ManualRoot(), sqlite)
+    added = sqlite.add('tasks', Task(title="Batched", priority="High"))
+    sqlite.update('tasks', added.id, completed=True)
+    
+    # Queries on the store's connection already see the change
+    assert added.id in ids(sqlite.find_tasks(completed=True))
+    other = sqlite3.connect(str(tmp_path / 'data.db'))
+    assert other.execute("SELECT COUNT(*) FROM tasks WHERE uid = ?", (added.id,)).fetchone()[0] == 0
+    
+    saver.flush()
+    assert other.execute("SELECT completed FROM tasks WHERE uid = ?", (added.id,)).fetchone()[0] == 1